@@ -6,12 +6,21 @@ from PySide2.QtGui import *
 
 import sys
 import time
+import threading
+import argparse
+import signal
+import multiprocessing
+import struct
+import hashlib
+import shlex
+import queue
 
 from autobahn.twisted.websocket import WebSocketServerProtocol, WebSocketServerFactory, listenWS
+from autobahn.websocket.compress import PerMessageDeflateOffer, PerMessageDeflateOfferAccept
 from twisted.internet import reactor
 from twisted.python import log
 from twisted.web.server import Site
-from twisted.web.static import File
+from twisted.web.resource import Resource
 
 import json
 import serial
@@ -25,10 +34,13 @@ import numpy
 import cv2
 from cv2 import * # OpenCV imports
 import psutil # CPU usage
-import subprocess # ssocr command line calling
-import re # Integers only from ssocr output
+import subprocess # Helper processes of ExternalRecognizer
+import re
+import string
 import requests
 
+from scoreboard_server import _gameFrameProtocol, _scoreboardFeedURL, MetricsPage, OverlayAssets, ScoreboardBroadcast, ScoreboardFeedPoller, serverMetrics
+
 if getattr(sys, 'frozen', False):
 	_applicationPath = os.path.dirname(sys.executable)
 elif __file__:
@@ -36,9 +48,31 @@ elif __file__:
 
 _settingsFilePath = os.path.join(_applicationPath, 'settings.ini')
 _athleteDataFilePath = os.path.join(_applicationPath, 'athlete_data.csv')
+_referenceDigitsPath = os.path.join(_applicationPath, 'ref_digits')
+_unknownDigitsPath = os.path.join(_applicationPath, 'unknown_digits')
 
 GroupBoxStyleSheet = "QGroupBox { border: 1px solid #AAAAAA;margin-top: 12px;} QGroupBox::title {top: -5px;left: 10px;}"
 
+# HSV ranges of lit scoreboard segments (yellow, red at both ends of the hue circle), as (lower, upper) for cv2.inRange
+ScoreboardHSVRanges = [
+	((20, 40, 40), (40, 255, 255)),
+	((170, 60, 60), (180, 255, 255)),
+	((0, 60, 60), (10, 255, 255))
+]
+
+# Scoreboard regions read by the OCR worker, in display order: (key, label, kind)
+# "digit" regions are matched against ref_digits/, "mean" regions report their mean brightness (colon, decimal point)
+OCRRegions = [
+	("clock_1", "Clock *0:00", "digit"),
+	("clock_2", "Clock 0*:00", "digit"),
+	("clock_3", "Clock 00:*0", "digit"),
+	("clock_4", "Clock 00:0*", "digit"),
+	("clock_colon", "Clock :", "mean"),
+	("shot_clock_1", "Shot Clock *0", "digit"),
+	("shot_clock_2", "Shot Clock 0*", "digit"),
+	("shot_clock_decimal", "Shot Clock .", "mean")
+]
+
 
 def shiftImage(in_img, x, y):
 	_img = in_img
@@ -79,6 +113,843 @@ def autocrop(image, threshold=0):
 	return image
 
 
+_erosionKernel = numpy.ones((2,2),numpy.uint8)
+
+_digitBitWeights = numpy.left_shift(numpy.uint64(1), numpy.arange(34, -1, -1, dtype=numpy.uint64))
+
+def packDigits(digits):
+	"""Packs 5x7 binary digit matrices into 35-bit integers (row-major, MSB first).
+	Accepts a single 7x5 matrix or a stack of them, returns a uint64 array.
+	"""
+	bits = numpy.asarray(digits).reshape(-1, 35) > 127
+	return numpy.dot(bits.astype(numpy.uint64), _digitBitWeights)
+
+
+def popcount64(values):
+	"""Vectorized population count of a uint64 array (SWAR bit counting)."""
+	values = numpy.asarray(values, dtype=numpy.uint64)
+	values = values - ((values >> numpy.uint64(1)) & numpy.uint64(0x5555555555555555))
+	values = (values & numpy.uint64(0x3333333333333333)) + ((values >> numpy.uint64(2)) & numpy.uint64(0x3333333333333333))
+	values = (values + (values >> numpy.uint64(4))) & numpy.uint64(0x0F0F0F0F0F0F0F0F)
+	return ((values * numpy.uint64(0x0101010101010101)) >> numpy.uint64(56)).astype(numpy.uint8)
+
+
+class ReferenceDigitBank(object):
+	"""Bit-packed bank of 5x7 reference digits.
+	Exact patterns are resolved with a dict lookup, everything else with one
+	vectorized Hamming distance pass over the stacked references.
+	"""
+	def __init__(self, packed, labels):
+		"""packed: uint64 codes from packDigits (a memory map is fine), labels: digit or "" per code."""
+		self.packed = numpy.asarray(packed, dtype=numpy.uint64)
+		self.labels = list(labels)
+		self.exact = {}
+		for _packed, _label in zip(self.packed.tolist(), self.labels):
+			self.exact[_packed] = _label # Later references win
+
+	def __len__(self):
+		return len(self.labels)
+
+	def match(self, packedDigits):
+		"""Returns a list of (label, distance) tuples, one per packed digit.
+		Distance is 0 for exact matches, otherwise the Hamming distance to the nearest reference.
+		"""
+		results = [None] * len(packedDigits)
+		misses = []
+		for index, _packed in enumerate(packedDigits):
+			_label = self.exact.get(int(_packed))
+			if _label is None:
+				misses.append(index)
+			else:
+				results[index] = (_label, 0)
+
+		if misses:
+			if not self.labels:
+				for index in misses:
+					results[index] = (None, 35)
+				return results
+			_missed = numpy.array([packedDigits[index] for index in misses], dtype=numpy.uint64)
+			distances = popcount64(_missed[:, None] ^ self.packed[None, :])
+			nearest = distances.argmin(1)
+			for row, index in enumerate(misses):
+				results[index] = (self.labels[nearest[row]], int(distances[row, nearest[row]]))
+
+		return results
+
+
+def _noMark(stage):
+	pass
+
+class Recognizer(object):
+	"""Recognition backend of SCOCRWorker.recognizeRegions, see recognizerBackends.
+	recognize() gets the digit regions of one frame that need reading as [(key, rect, region)],
+	region being the view of img_processed inside rect (digits dark on white), and returns one
+	(label, distance) per region: label a digit, "" for blank or None, distance how far the
+	reading is from a known pattern, accepted up to maxDistance.
+	Backends that build 5x7 glyphs keep those of the last batch in crops, glyphs and codes.
+	"""
+	name = None
+	maxDistance = 0
+	crops = glyphs = codes = None
+
+	def recognize(self, img_processed, regions, markStage=_noMark):
+		raise NotImplementedError
+
+	def prepare(self, timeout=0):
+		"""Starts what the backend needs before the first frame, waiting up to timeout seconds for it."""
+		pass
+
+	def close(self):
+		"""Releases what the backend holds, it may be used again afterwards."""
+		pass
+
+class TemplateRecognizer(Recognizer):
+	"""Inverts the window around the regions once, autocrops and resizes every region to 5x7
+	and matches the glyphs against a ReferenceDigitBank together.
+	"""
+	name = "templates"
+	maxDistance = 4 # Max Hamming distance (of 35 bits) accepted for a non-exact match
+
+	def __init__(self, referenceBank):
+		self.referenceBank = referenceBank
+
+	def recognize(self, img_processed, regions, markStage=_noMark):
+		##### INVERT THE WINDOW AROUND ALL REGIONS ONCE, THEN SLICE IT PER REGION #####
+		left, top = min(rect[0] for key, rect, region in regions), min(rect[1] for key, rect, region in regions)
+		right, bottom = max(rect[2] for key, rect, region in regions), max(rect[3] for key, rect, region in regions)
+		window = cv2.threshold(img_processed[top:bottom, left:right], 127, 255, cv2.THRESH_BINARY_INV)[1]
+		markStage("invert")
+		return self.recognizeInverted([window[tl_Y - top:br_Y - top, tl_X - left:br_X - left] for key, (tl_X, tl_Y, br_X, br_Y), region in regions], markStage)
+
+	def recognizeInverted(self, inverted, markStage=_noMark):
+		"""Reads regions already inverted (digits white on black), as recognize() and ocr_helper.py pass them."""
+		self.crops = []
+		resized = []
+		for region in inverted:
+			self.crops.append(autocrop(region, 10))
+			markStage("autocrop")
+			resized.append(cv2.resize(self.crops[-1], (5, 7)))
+			markStage("resize")
+
+		##### INVERT ALL 5x7 GLYPHS AT ONCE, COMPARE TO REFERENCE DIGITS #####
+		self.glyphs = numpy.where(numpy.stack(resized) > 127, 0, 255).astype(numpy.uint8)
+		packed = packDigits(self.glyphs)
+		self.codes = packed.tolist()
+		return self.referenceBank.match(packed)
+
+
+# Segment zones a-g (top, upper right, lower right, bottom, lower left, upper left, middle)
+# as (left, top, right, bottom) fractions of a digit box
+_segmentZones = numpy.array([
+	[0.25, 0.0, 0.75, 0.12],
+	[0.75, 0.12, 1.0, 0.45],
+	[0.75, 0.55, 1.0, 0.88],
+	[0.25, 0.88, 0.75, 1.0],
+	[0.0, 0.55, 0.25, 0.88],
+	[0.0, 0.12, 0.25, 0.45],
+	[0.25, 0.44, 0.75, 0.56],
+])
+_segmentBits = 1 << numpy.arange(7)
+_segmentPatterns = [ # Lit segments per digit, with the usual variants of 6, 7 and 9
+	("", ""), (0, "abcdef"), (1, "bc"), (2, "abdeg"), (3, "abcdg"), (4, "bcfg"), (5, "acdfg"),
+	(6, "acdefg"), (6, "cdefg"), (7, "abc"), (7, "abcf"), (8, "abcdefg"), (9, "abcdfg"), (9, "abcfg"),
+]
+
+class SegmentDecoder(Recognizer):
+	"""Seven-segment recognizer working on the digit boxes directly, without autocrop or resize.
+	The dark pixels of the seven zones of every box are counted together from one integral
+	image, a zone filled past fillRatio is a lit segment, and the 7-bit pattern is looked up
+	in a 128-entry table. Patterns one segment off a single digit read as that digit.
+	"""
+	name = "segments"
+
+	def __init__(self, fillRatio=0.35, maxDistance=1):
+		self.fillRatio = fillRatio
+		self.maxDistance = maxDistance
+		self._zones = {} # (frame shape, boxes) -> window, zone corners and fill thresholds
+		self.labels = [None] * 128
+		self.distances = [7] * 128 # Unreadable patterns, rejected like a distant template match
+		_codes = [(label, sum(1 << "abcdefg".index(segment) for segment in segments)) for label, segments in _segmentPatterns]
+		for pattern in range(128):
+			_nearest = {}
+			for label, code in _codes:
+				_distance = bin(pattern ^ code).count("1")
+				_nearest[label] = min(_nearest.get(label, 7), _distance)
+			_distance = min(_nearest.values())
+			_labels = [label for label in _nearest if _nearest[label] == _distance]
+			if _distance <= maxDistance and len(_labels) == 1:
+				self.labels[pattern] = _labels[0]
+				self.distances[pattern] = _distance
+
+	def zones(self, shape, rects):
+		"""Returns the window around rects and the zone corners relative to it, cached per boxes."""
+		_key = (shape[:2], tuple(rects))
+		plan = self._zones.get(_key)
+		if plan is not None:
+			return plan
+		rows, cols = shape[:2]
+		rects = numpy.array(rects, dtype=numpy.float64).reshape(-1, 4)
+		rects[:, 0::2] = rects[:, 0::2].clip(0, cols) # Same clipping as the numpy slices of the other recognizer
+		rects[:, 1::2] = rects[:, 1::2].clip(0, rows)
+		left, top = int(rects[:, 0].min()), int(rects[:, 1].min())
+		right, bottom = int(rects[:, 2].max()), int(rects[:, 3].max())
+
+		width = (rects[:, 2] - rects[:, 0])[:, None]
+		height = (rects[:, 3] - rects[:, 1])[:, None]
+		x0 = (rects[:, 0:1] - left + width * _segmentZones[:, 0]).astype(numpy.intp)
+		y0 = (rects[:, 1:2] - top + height * _segmentZones[:, 1]).astype(numpy.intp)
+		x1 = numpy.maximum((rects[:, 0:1] - left + width * _segmentZones[:, 2]).astype(numpy.intp), x0 + 1).clip(0, right - left)
+		y1 = numpy.maximum((rects[:, 1:2] - top + height * _segmentZones[:, 3]).astype(numpy.intp), y0 + 1).clip(0, bottom - top)
+		x0, y0 = numpy.minimum(x0, x1), numpy.minimum(y0, y1)
+		minimumDark = self.fillRatio * 255 * numpy.maximum((x1 - x0) * (y1 - y0), 1) # Dark pixels count 255
+
+		if len(self._zones) >= 64: # Boxes are being edited
+			self._zones.clear()
+		plan = self._zones[_key] = ((slice(top, bottom), slice(left, right)), (y0, x0, y1, x1), minimumDark)
+		return plan
+
+	def decode(self, img_processed, rects):
+		"""Returns [(label, distance)] for the (TL X, TL Y, BR X, BR Y) digit boxes of img_processed,
+		distance being the number of segments that differ from the digit.
+		"""
+		window, (y0, x0, y1, x1), minimumDark = self.zones(img_processed.shape, rects)
+		integral = cv2.integral(cv2.compare(img_processed[window], 127, cv2.CMP_LT), sdepth=cv2.CV_32S)
+		dark = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+		patterns = (dark > minimumDark).dot(_segmentBits)
+		return [(self.labels[pattern], self.distances[pattern]) for pattern in patterns.tolist()]
+
+	def recognize(self, img_processed, regions, markStage=_noMark):
+		return self.decode(img_processed, [rect for key, rect, region in regions])
+
+_referenceFileName = re.compile(r"^(?:(\d)([A-Za-z]+)|(\d)_(\d+)|(blank)(?:_(\d+))?)\.png$")
+_bankHeader = struct.Struct("<8sI32s4x") # Magic, count, source signature; 48 bytes keeps the codes 8-byte aligned
+_bankMagic = b"SCBANK01"
+
+def referenceTemplateFiles(directory):
+	"""Returns [(label, path)] for the templates in directory, named <digit><variant>.png,
+	<digit>_<n>.png, blank.png or blank_<n>.png (label ""), in the order they are applied:
+	by digit, blank last.
+	"""
+	templates = []
+	for name in os.listdir(directory):
+		match = _referenceFileName.match(name)
+		if match is None:
+			continue
+		letterDigit, letters, numberDigit, number, blank, blankNumber = match.groups()
+		if blank:
+			order = (10, int(blankNumber or 0), "")
+		elif letterDigit:
+			order = (int(letterDigit), 0, letters)
+		else:
+			order = (int(numberDigit), int(number), "")
+		templates.append((order, os.path.join(directory, name)))
+	templates.sort()
+	return [("" if order[0] == 10 else order[0], path) for order, path in templates]
+
+def compileReferenceBank(directory, bankPath):
+	"""Returns (packed, labels) for the templates in directory, memory-mapped from bankPath.
+	bankPath is rebuilt whenever a template is added, removed or has a different mtime or size.
+	When it cannot be written the templates are packed in memory.
+	"""
+	templates = referenceTemplateFiles(directory)
+	_stats = [(os.path.basename(path), os.stat(path).st_mtime_ns, os.stat(path).st_size) for label, path in templates]
+	signature = hashlib.sha256(repr(_stats).encode('utf8')).digest()
+
+	try:
+		with open(bankPath, 'rb') as f:
+			magic, count, _signature = _bankHeader.unpack(f.read(_bankHeader.size))
+		if magic == _bankMagic and _signature == signature:
+			packed = numpy.memmap(bankPath, dtype=numpy.uint64, mode='r', offset=_bankHeader.size, shape=(count,)) if count else numpy.zeros(0, numpy.uint64)
+			codes = numpy.memmap(bankPath, dtype=numpy.int8, mode='r', offset=_bankHeader.size + 8 * count, shape=(count,)) if count else []
+			return packed, ["" if code < 0 else int(code) for code in codes]
+	except (IOError, OSError, struct.error):
+		pass
+
+	##### DECODE AND PACK THE PNGS, WRITE THE BANK NEXT TO THEM #####
+	digits = [(label, cv2.imread(path, 0)) for label, path in templates]
+	digits = [(label, digit) for label, digit in digits if digit is not None]
+	packed = packDigits([digit for label, digit in digits]) if digits else numpy.zeros(0, numpy.uint64)
+	labels = [label for label, digit in digits]
+	try:
+		with open(bankPath + '.tmp', 'wb') as f:
+			f.write(_bankHeader.pack(_bankMagic, len(labels), signature))
+			f.write(packed.astype('<u8').tobytes())
+			f.write(numpy.array([-1 if label == "" else label for label in labels], dtype=numpy.int8).tobytes())
+		os.replace(bankPath + '.tmp', bankPath)
+	except (IOError, OSError) as e:
+		print("Could not write the template bank {}: {}".format(bankPath, e))
+	return packed, labels
+
+_referenceBanks = {} # Shared between workers, keyed by (directory, source signature)
+
+def loadReferenceBank(directory=_referenceDigitsPath):
+	"""Returns the ReferenceDigitBank for directory, compiled to templates.bank there."""
+	packed, labels = compileReferenceBank(directory, os.path.join(directory, 'templates.bank'))
+	_key = (directory, packed.tobytes(), tuple(labels))
+	if _key not in _referenceBanks:
+		_referenceBanks.clear() # Templates changed, the old bank is no longer used
+		_referenceBanks[_key] = ReferenceDigitBank(packed, labels)
+	return _referenceBanks[_key]
+
+
+def encodeRegions(regions):
+	"""Request of the ocr_helper.py protocol: uint32 count, then per region uint16 height,
+	uint16 width and the grayscale pixels row by row.
+	"""
+	chunks = [struct.pack("<I", len(regions))]
+	for region in regions:
+		chunks.append(struct.pack("<HH", region.shape[0], region.shape[1]))
+		chunks.append(numpy.ascontiguousarray(region, dtype=numpy.uint8).tobytes())
+	return b"".join(chunks)
+
+def decodeLabels(line, count):
+	"""Labels from a helper's reply, a JSON list of digit strings, "" for blank and null for unknown."""
+	labels = json.loads(line)
+	if not isinstance(labels, list) or len(labels) != count:
+		raise ValueError("Expected %d labels, got %r" % (count, line))
+	return [int(label) if label not in (None, "") else label for label in labels]
+
+class ExternalRecognizer(Recognizer):
+	"""Streams the regions of each frame to a pool of long-lived helper processes started from
+	command (see ocr_helper.py for the protocol), split over the helpers so they work in parallel.
+	Helpers start on first use and only get regions once they printed their ready line.
+	A helper that exits or misses timeout is restarted, its regions read as None for that frame.
+	"""
+	name = "external"
+	maxDistance = 0
+
+	def __init__(self, command, processes=2, timeout=0.5):
+		self.command = command
+		self.timeout = timeout # Seconds a frame waits for the helpers' replies
+		self.helpers = [None] * max(processes, 1)
+		self.batches = 0
+		self.failures = 0 # Batches lost to a dead, slow or unstartable helper
+		self.started = 0 # Helper processes started, more than the pool size after restarts
+		self.lastError = None
+
+	def helperArguments(self):
+		arguments = shlex.split(self.command, posix=(os.name != 'nt'))
+		if getattr(sys, 'frozen', False): # sys.executable is this application, other scripts need a system python
+			if arguments[:2] == ["python", "ocr_helper.py"]:
+				arguments = [sys.executable, "--ocr-helper"] + arguments[2:]
+		elif arguments and arguments[0] == "python": # The interpreter running this
+			arguments[0] = sys.executable
+		return arguments
+
+	def startHelper(self, index):
+		self.started += 1
+		process = subprocess.Popen(self.helperArguments(), stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=_applicationPath)
+		helper = {"process": process, "replies": queue.Queue(), "ready": threading.Event()}
+		threading.Thread(target=self.readReplies, args=(helper,), daemon=True).start()
+		self.helpers[index] = helper
+		return helper
+
+	@staticmethod
+	def readReplies(helper):
+		for line in iter(helper["process"].stdout.readline, b""):
+			if helper["ready"].is_set():
+				helper["replies"].put(line)
+			elif line.strip() == b"ready":
+				helper["ready"].set()
+		helper["replies"].put(None) # Exited
+
+	def stopHelper(self, index):
+		helper, self.helpers[index] = self.helpers[index], None
+		if helper is not None:
+			try:
+				helper["process"].stdin.close()
+			except (IOError, OSError):
+				pass
+			helper["process"].kill()
+			helper["process"].wait()
+
+	def prepare(self, timeout=0):
+		deadline = time.time() + timeout
+		for index, helper in self.startHelpers():
+			helper["ready"].wait(max(deadline - time.time(), 0))
+
+	def startHelpers(self):
+		"""Returns [(index, helper)] of the running helpers, starting those that are missing or exited."""
+		helpers = []
+		for index, helper in enumerate(self.helpers):
+			if helper is not None and helper["process"].poll() is not None:
+				self.stopHelper(index)
+				helper = None
+			if helper is None:
+				try:
+					helper = self.startHelper(index)
+				except (IOError, OSError) as e: # Tried again next frame
+					self.failures += 1
+					if str(e) != self.lastError:
+						self.lastError = str(e)
+						print("Could not start recognizer helper %r: %s" % (self.command, e))
+					continue
+			helpers.append((index, helper))
+		return helpers
+
+	def recognize(self, img_processed, regions, markStage=_noMark):
+		results = [(None, 1)] * len(regions)
+
+		##### SEND ONE BATCH PER READY HELPER, RESTART THOSE THAT EXITED #####
+		ready = [index for index, helper in self.startHelpers() if helper["ready"].is_set()]
+		sent = []
+		for position, index in enumerate(ready):
+			positions = list(range(position, len(regions), len(ready)))
+			if not positions:
+				continue
+			try:
+				self.helpers[index]["process"].stdin.write(encodeRegions([regions[i][2] for i in positions]))
+				self.helpers[index]["process"].stdin.flush()
+				sent.append((index, positions))
+			except (IOError, OSError):
+				self.failures += 1
+				self.stopHelper(index)
+		markStage("roi")
+
+		##### COLLECT THE REPLIES UNTIL THE DEADLINE #####
+		deadline = time.time() + self.timeout
+		for index, positions in sent:
+			self.batches += 1
+			try:
+				line = self.helpers[index]["replies"].get(timeout=max(deadline - time.time(), 0))
+				if line is None:
+					raise ValueError("Helper exited")
+				for position, label in zip(positions, decodeLabels(line, len(positions))):
+					results[position] = (label, 0) if label is not None else (None, 1)
+			except (queue.Empty, ValueError): # Restarted, so a late reply is never taken for the next frame's
+				self.failures += 1
+				self.stopHelper(index)
+		markStage("match")
+		return results
+
+	def close(self):
+		for index in range(len(self.helpers)):
+			self.stopHelper(index)
+
+_defaultRecognizerCommand = "python ocr_helper.py --engine ssocr"
+
+# Recognizer backends by name, each built as backend(command) with the helper command line.
+# Anything returning a Recognizer can be added.
+recognizerBackends = {
+	"templates": lambda command: TemplateRecognizer(loadReferenceBank()),
+	"segments": lambda command: SegmentDecoder(),
+	"external": lambda command: ExternalRecognizer(command or _defaultRecognizerCommand),
+}
+
+def createRecognizer(name, command=""):
+	if name not in recognizerBackends:
+		raise ValueError("Unknown recognizer %r, expected one of %s" % (name, ", ".join(sorted(recognizerBackends))))
+	return recognizerBackends[name](command)
+
+
+def hsvMask(img_HSV, hsvRanges):
+	"""Returns 0 where img_HSV falls in any of hsvRanges, 255 elsewhere."""
+	th3 = None
+	for lower, upper in hsvRanges:
+		thresh = cv2.inRange(img_HSV, lower, upper)
+		th3 = thresh if th3 is None else th3 + thresh
+	ret3, th3 = cv2.threshold(th3, 127, 255, cv2.THRESH_BINARY_INV)
+	return th3
+
+
+class ColourMaskTable(object):
+	"""Packed bitset over quantized BGR colours, one bit per colour cell, set when the cell's
+	HSV value falls in any of the ranges. Turns a BGR image into the same mask as
+	cvtColor + inRange + threshold with a single table lookup per pixel.
+	With 8 bits per channel (2 MB) the table is exact, fewer bits trade accuracy for size.
+	"""
+	def __init__(self, hsvRanges, bitsPerChannel=8):
+		self.hsvRanges = [tuple(map(tuple, hsvRange)) for hsvRange in hsvRanges]
+		self.bitsPerChannel = bitsPerChannel
+		q = bitsPerChannel
+		cells = numpy.arange(1 << (3*q), dtype=numpy.uint32)
+		self.bits = numpy.zeros(max((1 << (3*q)) // 8, 1), dtype=numpy.uint8)
+		chunk = 1 << 20 # Classify a million cells at a time to keep the temporary images small
+		for start in range(0, cells.size, chunk):
+			_cells = cells[start:start + chunk]
+			bgr = numpy.stack([_cells & ((1 << q) - 1), (_cells >> q) & ((1 << q) - 1), _cells >> (2*q)], -1)
+			if q < 8: # Classify each cell by its centre colour
+				bgr = (bgr << (8 - q)) | (1 << (7 - q))
+			inRange = hsvMask(cv2.cvtColor(bgr.astype(numpy.uint8).reshape(1, -1, 3), cv2.COLOR_BGR2HSV), self.hsvRanges).reshape(-1) == 0
+			_packed = numpy.packbits(inRange, bitorder='little')
+			self.bits[start // 8:start // 8 + _packed.size] |= _packed
+
+	def mask(self, img):
+		"""Returns 0 where the BGR image has a scoreboard colour, 255 elsewhere."""
+		img = numpy.ascontiguousarray(img)
+		packed = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA).view(numpy.uint32)[..., 0] # B | G << 8 | R << 16 | A << 24
+		q = self.bitsPerChannel
+		if q == 8:
+			index = packed >> numpy.uint32(3)
+			index &= numpy.uint32(0x1FFFFF)
+			bit = img[..., 0] & numpy.uint8(7) # Low bits of the cell index are the low bits of blue
+		else:
+			m = (1 << q) - 1
+			cell = ((packed >> numpy.uint32(8 - q)) & numpy.uint32(m)) | ((packed >> numpy.uint32(16 - 2*q)) & numpy.uint32(m << q)) | ((packed >> numpy.uint32(24 - 3*q)) & numpy.uint32(m << 2*q))
+			index = cell >> numpy.uint32(3)
+			bit = (cell & numpy.uint32(7)).astype(numpy.uint8)
+		byte = numpy.take(self.bits, index)
+		numpy.right_shift(byte, bit, out=byte)
+		byte &= numpy.uint8(1)
+		return cv2.compare(byte, 0, cv2.CMP_EQ)
+
+_colourMaskTables = {} # Shared between workers, keyed by (ranges, bits per channel)
+
+def colourMaskTable(hsvRanges, bitsPerChannel=8):
+	_key = (repr(hsvRanges), bitsPerChannel)
+	if _key not in _colourMaskTables:
+		_colourMaskTables[_key] = ColourMaskTable(hsvRanges, bitsPerChannel)
+	return _colourMaskTables[_key]
+
+
+class ClockScheduler(object):
+	"""Running-clock model that picks the digit regions to read in a frame.
+	The lowest digit of each clock is read every frame. A higher digit is read in the same frame
+	when the digit below it changed by anything but one step (a carry or borrow), and at least
+	every verifyInterval seconds. A verification read that finds an unexpected change, or a
+	change of display mode (colon, shot clock decimal), re-reads every digit.
+	"""
+	def __init__(self, verifyInterval=1.0):
+		self.verifyInterval = verifyInterval
+		self.lastRead = {} # Region key -> time.time() of its last read
+		self.modes = None # (colon shown, shot clock decimal shown) of the last frame
+		self.predictedReads = 0 # Higher digits read because the digit below rolled over
+		self.verifyReads = 0
+		self.fullReads = 0 # Frames read entirely after a mode change or disagreement
+		self.disagreements = 0
+		self.skippedReads = 0
+
+	@staticmethod
+	def chains(regionMeans):
+		"""Returns the display modes and the digit regions of each clock, fastest-changing first."""
+		colon = regionMeans.get("clock_colon", 0) < 100 # Same tests as SCOCRWorker.formatClocks
+		decimal = regionMeans.get("shot_clock_decimal", 255) <= 100
+		clock = ["clock_4", "clock_3", "clock_2", "clock_1"] if colon else ["clock_3", "clock_2", "clock_1", "clock_4"] # clock_4 unused in MM.S
+		return (colon, decimal), [clock, ["shot_clock_2", "shot_clock_1"]]
+
+	@staticmethod
+	def rolledOver(old, new):
+		"""False when a digit kept its value or moved by one step, the only changes without a carry."""
+		old, new = str(old), str(new) # Labels are ints, "" for a blank digit
+		if old == new:
+			return False
+		if old.isdigit() and new.isdigit():
+			return abs(int(old) - int(new)) != 1
+		return True
+
+	def due(self, key, now):
+		return now - self.lastRead.get(key, 0) >= self.verifyInterval
+
+
+class GlyphCaptureStore(object):
+	"""Collects the 5x7 glyphs that matched no reference exactly, deduplicated by packed code
+	with occurrence counts, for review and promotion into ref_digits/ (see promoteGlyph).
+	add() only updates a dict; a background thread writes new glyphs as <code>.png, plus
+	index.json and index.html sorted by count, to directory every flushInterval seconds.
+	At most maxGlyphs are kept, a new glyph evicts the least seen one.
+	"""
+	def __init__(self, directory=_unknownDigitsPath, maxGlyphs=1000, flushInterval=5.0):
+		self.directory = directory
+		self.maxGlyphs = maxGlyphs
+		self.flushInterval = flushInterval
+		self.entries = {} # Packed code -> {"count", "first_seen", "last_seen", "nearest", "distance", "regions"}
+		self.glyphs = {} # Packed code -> glyph not written yet
+		self.removed = set() # Evicted codes whose PNG is still on disk
+		self.reads = 0 # Glyphs added, including repeats
+		self.evicted = 0
+		self._dirty = False
+		self._lock = threading.Lock()
+		self._stop = threading.Event()
+		self._thread = None
+		self.load()
+
+	@staticmethod
+	def fileName(code):
+		return "%09x.png" % code # 35 bits
+
+	def load(self):
+		"""Continues the counts of index.json from an earlier run."""
+		try:
+			with open(os.path.join(self.directory, 'index.json')) as f:
+				for entry in json.load(f):
+					entry.pop("file", None)
+					self.entries[int(entry.pop("code"), 16)] = entry
+		except (IOError, OSError, ValueError, KeyError):
+			pass
+
+	def add(self, code, glyph, label, distance, key):
+		"""Counts one read of glyph (packed code), whose nearest reference is label at distance. Called per frame."""
+		now = time.time()
+		with self._lock:
+			self.reads += 1
+			self._dirty = True
+			entry = self.entries.get(code)
+			if entry is None:
+				if len(self.entries) >= self.maxGlyphs:
+					_evict = min(self.entries, key=lambda _code: (self.entries[_code]["count"], self.entries[_code]["last_seen"]))
+					del self.entries[_evict]
+					self.glyphs.pop(_evict, None)
+					self.removed.add(_evict) # Its PNG may have been written already
+					self.evicted += 1
+				entry = self.entries[code] = {"count": 0, "first_seen": now, "nearest": label, "distance": distance, "regions": {}}
+				self.glyphs[code] = glyph.copy()
+				self.removed.discard(code)
+			entry["count"] += 1
+			entry["last_seen"] = now
+			entry["regions"][key] = entry["regions"].get(key, 0) + 1
+
+	def start(self):
+		self._thread = threading.Thread(target=self.run, name="GlyphCaptureStore", daemon=True)
+		self._thread.start()
+
+	def run(self):
+		while not self._stop.wait(self.flushInterval):
+			self.flush()
+		self.flush()
+
+	def close(self):
+		"""Stops the writer thread after a last flush."""
+		self._stop.set()
+		if self._thread is not None:
+			self._thread.join()
+
+	def flush(self):
+		with self._lock:
+			if not self._dirty:
+				return
+			self._dirty = False
+			entries = sorted(((code, dict(entry, regions=dict(entry["regions"]))) for code, entry in self.entries.items()), key=lambda item: -item[1]["count"])
+			glyphs, self.glyphs = self.glyphs, {}
+			removed, self.removed = self.removed, set()
+
+		##### WRITE OUTSIDE THE LOCK, THE OCR LOOP KEEPS ADDING #####
+		try:
+			if not os.path.isdir(self.directory):
+				os.makedirs(self.directory)
+			for code, glyph in glyphs.items():
+				cv2.imwrite(os.path.join(self.directory, self.fileName(code)), glyph)
+			for code in removed:
+				try:
+					os.remove(os.path.join(self.directory, self.fileName(code)))
+				except OSError:
+					pass
+			index = [dict(entry, code="%09x" % code, file=self.fileName(code)) for code, entry in entries]
+			with open(os.path.join(self.directory, 'index.json.tmp'), 'w') as f:
+				json.dump(index, f, indent=1)
+			os.replace(os.path.join(self.directory, 'index.json.tmp'), os.path.join(self.directory, 'index.json'))
+			with open(os.path.join(self.directory, 'index.html'), 'w') as f:
+				f.write("<style>\n\timg {\n\t\twidth:40px;\n\t\tborder:1px solid red;\n\t\timage-rendering: pixelated;\n\t}\n</style>\n\n")
+				for entry in index:
+					f.write("<div><img src='{file}'> {code}: {count} reads, nearest {nearest!r} at {distance}</div>\n".format(**entry))
+		except (IOError, OSError) as e:
+			print(e)
+			with self._lock: # Try again on the next flush
+				for code, glyph in glyphs.items():
+					if code in self.entries:
+						self.glyphs.setdefault(code, glyph)
+				self.removed |= removed - set(self.entries)
+				self._dirty = True
+
+def promoteGlyph(code, label, directory=_unknownDigitsPath, referenceDirectory=_referenceDigitsPath):
+	"""Copies captured glyph code (hex, as in index.json) into referenceDirectory as the next
+	<label>_<n>.png, or blank_<n>.png for label "". Running workers pick it up on their next start.
+	"""
+	glyph = cv2.imread(os.path.join(directory, GlyphCaptureStore.fileName(int(code, 16))), 0)
+	if glyph is None:
+		raise IOError("No captured glyph " + code)
+	prefix = "blank" if str(label) == "" else str(int(label))
+	_numbers = [int(name[len(prefix) + 1:-4]) for name in os.listdir(referenceDirectory) if re.match(r"^%s_\d+\.png$" % prefix, name)]
+	path = os.path.join(referenceDirectory, "%s_%d.png" % (prefix, max(_numbers + [0]) + 1))
+	cv2.imwrite(path, glyph)
+	return path
+
+
+def gamePacket(digitDict):
+	"""Returns the WebSocket update for the clocks in SCOCRWorker.retOCRDigits."""
+	return {
+		"game": {
+			"shot_clock": digitDict["shot_clock"],
+			"clock": digitDict["clock"],
+		}
+	}
+
+class RegionConfig(object):
+	"""Bounding boxes of OCRRegions compiled from the GUI's coordinate lists, {key: [label,
+	TL X, TL Y, BR X, BR Y, ...]} of strings. Never changed once built: the GUI swaps in a new
+	one with each edit and the OCR loop takes one per frame, so it never parses strings or sees
+	half an edit. Boxes that are empty are left out, those that are not numbers are listed in errors.
+	"""
+	def __init__(self, OCRCoordinatesList=None):
+		rects = {}
+		errors = []
+		for key, label, kind in OCRRegions:
+			_coords = (OCRCoordinatesList or {}).get(key)
+			if not _coords:
+				continue
+			try:
+				tl_X, tl_Y, br_X, br_Y = [int('0' + str(value).strip()) for value in _coords[1:5]]
+			except ValueError:
+				errors.append(key)
+				continue
+			if br_X > tl_X and br_Y > tl_Y:
+				rects[key] = (tl_X, tl_Y, br_X, br_Y)
+		self.rects = rects # Key -> (TL X, TL Y, BR X, BR Y)
+		self.errors = tuple(errors)
+		self._clipped = {} # (rows, cols) -> boxes, missing keys and union, see clipped()
+
+	def rect(self, key):
+		"""Returns (TL X, TL Y, BR X, BR Y) of a region, zeros when it has no box."""
+		return self.rects.get(key, (0, 0, 0, 0))
+
+	def clipped(self, rows, cols):
+		"""Returns (boxes, missing, window) for a rows x cols frame: boxes is ((key, kind, rect,
+		slices)) of the regions inside it in OCRRegions order, rects clipped to the frame and slices
+		indexing an image with them, missing the keys without one, and window the union of the
+		boxes as (y0, y1, x0, x1) or None. Built once per frame size.
+		"""
+		plan = self._clipped.get((rows, cols))
+		if plan is None:
+			boxes = []
+			for key, label, kind in OCRRegions:
+				tl_X, tl_Y, br_X, br_Y = self.rect(key)
+				tl_X, br_X = min(tl_X, cols), min(br_X, cols)
+				tl_Y, br_Y = min(tl_Y, rows), min(br_Y, rows)
+				if br_X > tl_X and br_Y > tl_Y:
+					boxes.append((key, kind, (tl_X, tl_Y, br_X, br_Y), (slice(tl_Y, br_Y), slice(tl_X, br_X))))
+			window = None
+			if boxes:
+				window = (min(rect[1] for key, kind, rect, slices in boxes), max(rect[3] for key, kind, rect, slices in boxes),
+					min(rect[0] for key, kind, rect, slices in boxes), max(rect[2] for key, kind, rect, slices in boxes))
+			_keys = set(key for key, kind, rect, slices in boxes)
+			plan = self._clipped[(rows, cols)] = (tuple(boxes), tuple(key for key, label, kind in OCRRegions if key not in _keys), window)
+		return plan
+
+_digitKeys = frozenset(key for key, label, kind in OCRRegions if kind == "digit")
+_meanKeys = frozenset(key for key, label, kind in OCRRegions if kind == "mean")
+
+def cameraFields(OCRCoordinatesList):
+	"""Returns the game fields whose digit regions have a bounding box in OCRCoordinatesList."""
+	rects = RegionConfig(OCRCoordinatesList).rects
+	return [field for field in ("clock", "shot_clock") if any(key.startswith(field + "_") for key in rects if key in _digitKeys)]
+
+def loadWorkerSettings(settingsFilePath=_settingsFilePath):
+	"""Returns the SCOCRWorker keyword arguments saved by Window in settings.ini, with the same defaults."""
+	qsettings = QSettings(settingsFilePath, QSettings.IniFormat)
+	qsettings.setFallbacksEnabled(False)
+	_isChecked = lambda key: str(qsettings.value(key, "false")).lower() == "true"
+	return {
+		"OCRCoordinatesList": qsettings.value("OCRcoordinates") or {},
+		"ssocrArguments": qsettings.value("SCssocrArguments", "crop 0 0 450 200 mirror horiz shear 10 mirror horiz gray_stretch 100 254 invert remove_isolated -T "),
+		"waitKey": qsettings.value("SCwaitKey", '300'),
+		"videoCaptureIndex": qsettings.value("SCvideoCaptureIndex", '0'),
+		"rotation": qsettings.value("SCrotation", "0"),
+		"erosion": qsettings.value("SCerosion", "2"),
+		"cropLeft": qsettings.value("LCrop", "0"),
+		"cropTop": qsettings.value("TCrop", "0"),
+		"roiOnly": _isChecked("SCroiOnly"),
+		"colourLUT": _isChecked("SCcolourLUT"),
+		"previewFPS": qsettings.value("SCpreviewFPS", "5"),
+		"clockModel": _isChecked("SCclockModel"),
+		"captureUnknown": _isChecked("SCcaptureUnknown"),
+		"recognizer": qsettings.value("SCrecognizer", "templates"),
+		"recognizerCommand": qsettings.value("SCrecognizerCommand", _defaultRecognizerCommand),
+	}
+
+
+_playerTickerFormat = u"{隊伍} #{No} {姓名} {位置}  {出賽場次}場 平均 {平均得分}分 {平均籃板}籃板 {平均助攻}助攻 {平均抄截}抄截 {平均火鍋}火鍋  三分 {三分命中率}% 罰球 {罰球命中率}%"
+
+class PlayerStatsStore(object):
+	"""Season stats of athlete_data.csv as columns (header -> tuple of strings, one per player),
+	indexed by team (隊伍) and jersey number (No., read as No since str.format cannot look up a key
+	with a dot). Ticker lines are rendered on first use and kept, a tickerFormat field missing from
+	the file raises KeyError.
+	refresh() re-reads the file only when its mtime or size changed; players whose line is
+	unchanged keep their parsed row and rendered ticker line.
+	"""
+	def __init__(self, path=_athleteDataFilePath, tickerFormat=_playerTickerFormat):
+		self.path = path
+		self.tickerFormat = tickerFormat
+		self.headers = ()
+		self.columns = {}
+		self.index = {} # (team, number) -> tuple of player rows, numbers may repeat within a team
+		self.teams = ()
+		self.reloads = 0
+		self._lines = () # Raw line per row, to reuse unchanged rows on reload
+		self._rows = () # Parsed values per row
+		self._tickers = [] # Rendered ticker line per row, None until used
+		self._signature = None
+		self.refresh()
+
+	def refresh(self):
+		"""Reloads the file if it changed, returns whether it did."""
+		try:
+			_stat = os.stat(self.path)
+		except OSError:
+			return False
+		signature = (_stat.st_mtime_ns, _stat.st_size)
+		if signature == self._signature:
+			return False
+		with open(self.path, 'rb') as f:
+			lines = f.read().splitlines()
+		self._signature = signature
+		if not lines:
+			return False
+
+		##### PARSE ONLY NEW OR EDITED LINES #####
+		headers = tuple(u"No" if header == u"No." else header for header in next(unicodecsv.reader(lines[:1], encoding='utf-8-sig')))
+		self.checkTickerFormat(headers)
+		if headers != self.headers:
+			self._lines, self._rows, self._tickers = (), (), []
+		previous = dict((line, row) for row, line in enumerate(self._lines))
+		lines = [line for line in lines[1:] if line.strip()]
+		rows, tickers = [], []
+		for line in lines:
+			row = previous.get(line)
+			if row is None:
+				values = tuple(next(unicodecsv.reader([line], encoding='utf-8')))[:len(headers)]
+				rows.append(values + (u"",) * (len(headers) - len(values)))
+				tickers.append(None)
+			else:
+				rows.append(self._rows[row])
+				tickers.append(self._tickers[row])
+
+		index = {}
+		columns = dict(zip(headers, zip(*rows))) if rows else dict((header, ()) for header in headers)
+		for row, (team, number) in enumerate(zip(columns.get(u"隊伍", ()), columns.get(u"No", ()))):
+			index.setdefault((team, number.strip()), []).append(row)
+
+		self.headers, self.columns, self._lines, self._rows, self._tickers = headers, columns, tuple(lines), tuple(rows), tickers
+		self.index = dict((key, tuple(rows)) for key, rows in index.items())
+		self.teams = tuple(sorted(set(columns.get(u"隊伍", ()))))
+		self.reloads += 1
+		return True
+
+	def players(self, team, number):
+		"""Returns the rows of the players of team wearing number."""
+		return self.index.get((team, str(number).strip()), ())
+
+	def checkTickerFormat(self, headers):
+		"""Raises KeyError unless every field of tickerFormat is a column of headers and at least
+		one of them is a stat, not just the team, number and name.
+		"""
+		fields = set(field for text, field, spec, conversion in string.Formatter().parse(self.tickerFormat) if field)
+		if fields - set(headers):
+			raise KeyError("Ticker fields not in %s: %s" % (self.path, u", ".join(sorted(fields - set(headers)))))
+		if not fields - set([u"隊伍", u"No", u"姓名"]):
+			raise KeyError("Ticker format shows no stats: %s" % self.tickerFormat)
+
+	def tickerLine(self, row):
+		if self._tickers[row] is None:
+			self._tickers[row] = self.tickerFormat.format_map(dict(zip(self.headers, self._rows[row])))
+		return self._tickers[row]
+
+	def ticker(self, team, number):
+		"""Returns the ticker text of the players of team wearing number, "" if there is none.
+		Call refresh() first to pick up edits of the file.
+		"""
+		return u" / ".join(self.tickerLine(row) for row in self.players(team, number))
+
+
 class MainWindow(QtWidgets.QMainWindow):
 	def __init__(self, parent=None):
 		super(MainWindow, self).__init__(parent)
@@ -112,6 +983,15 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.resize(1000,400)
 		self.show()
 
+	def closeEvent(self, event):
+		self.main_widget.terminate_SCOCRWorker() # Release the camera before quitting
+		event.accept()
+
+	def changeEvent(self, event):
+		if event.type() == QtCore.QEvent.WindowStateChange:
+			self.main_widget.setPreviewVisible(not self.isMinimized()) # No preview frames while minimised
+		super(MainWindow, self).changeEvent(event)
+
 
 class Window(QtWidgets.QWidget):
 	def __init__(self, parent):
@@ -119,6 +999,7 @@ class Window(QtWidgets.QWidget):
 		grid = QtWidgets.QGridLayout()
 		self.qsettings = QSettings(_settingsFilePath, QSettings.IniFormat)
 		self.qsettings.setFallbacksEnabled(False)
+		self.SCOCRWorker = None # Created by init_SCOCRWorker
 
 		self.updateScoreboard = QtWidgets.QPushButton("Update")
 		self.updateScoreboard.clicked.connect(self.sendCommandToBrowser)
@@ -133,27 +1014,46 @@ class Window(QtWidgets.QWidget):
 		self.tickerTextRadio = QtWidgets.QRadioButton("Text")
 		self.tickerStatsRadio = QtWidgets.QRadioButton("Player Stats")
 		self.tickerTextLineEdit = QtWidgets.QLineEdit("")
+		self.playerStats = PlayerStatsStore()
+		self.tickerStatsTeam = QtWidgets.QComboBox()
+		self.tickerStatsTeam.addItems(self.playerStats.teams)
+		self.tickerStatsNumber = QtWidgets.QLineEdit("")
+		self.tickerStatsNumber.setPlaceholderText("No.")
 		self.gameOverCheckBox = QtWidgets.QCheckBox("Game Over")
 
 
-		self.GCOCRCoordinates = {
-			"clock_1": [QtWidgets.QLabel("Clock *0:00"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"clock_2": [QtWidgets.QLabel("Clock 0*:00"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"clock_3": [QtWidgets.QLabel("Clock 00:*0"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"clock_4": [QtWidgets.QLabel("Clock 00:0*"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"clock_colon": [QtWidgets.QLabel("Clock :"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"shot_clock_1": [QtWidgets.QLabel("Shot Clock *0"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"shot_clock_2": [QtWidgets.QLabel("Shot Clock 0*"), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")],
-			"shot_clock_decimal": [QtWidgets.QLabel("Shot Clock ."), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")]
-		}
+		self.GCOCRCoordinates = {} # key: [label, TL X, TL Y, BR X, BR Y, width, height, scan, OCR]
+		for key, label, kind in OCRRegions:
+			self.GCOCRCoordinates[key] = [QtWidgets.QLabel(label), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLineEdit(""), QtWidgets.QLabel("0"), QtWidgets.QLabel("0"), QtWidgets.QLabel("*"), QtWidgets.QLabel("-")]
 
 		self.SCssocrArguments = QtWidgets.QLineEdit(self.qsettings.value("SCssocrArguments", "crop 0 0 450 200 mirror horiz shear 10 mirror horiz gray_stretch 100 254 invert remove_isolated -T "))
 		self.SCrotation = QtWidgets.QLineEdit(self.qsettings.value("SCrotation", "0"))
 		self.SCerosion = QtWidgets.QLineEdit(self.qsettings.value("SCerosion", "2"))
 		self.SCcropLeft = QtWidgets.QLineEdit(self.qsettings.value("LCrop", "0"))
 		self.SCcropTop = QtWidgets.QLineEdit(self.qsettings.value("TCrop", "0"))
+		self.SCroiOnly = QtWidgets.QCheckBox("ROI Only")
+		self.SCroiOnly.setToolTip("Only preprocess the part of the frame covered by the bounding boxes")
+		self.SCroiOnly.setChecked(str(self.qsettings.value("SCroiOnly", "false")).lower() == "true")
+		self.SCcolourLUT = QtWidgets.QCheckBox("Colour LUT")
+		self.SCcolourLUT.setToolTip("Threshold colours with a precomputed BGR lookup table instead of HSV conversion")
+		self.SCcolourLUT.setChecked(str(self.qsettings.value("SCcolourLUT", "false")).lower() == "true")
+		self.SCclockModel = QtWidgets.QCheckBox("Clock Model")
+		self.SCclockModel.setToolTip("Read the higher clock digits only on a predicted rollover or periodic check")
+		self.SCclockModel.setChecked(str(self.qsettings.value("SCclockModel", "false")).lower() == "true")
+		self.SCcaptureUnknown = QtWidgets.QCheckBox("Capture Unknown")
+		self.SCcaptureUnknown.setToolTip("Save digit glyphs without an exact reference to unknown_digits/ for review")
+		self.SCcaptureUnknown.setChecked(str(self.qsettings.value("SCcaptureUnknown", "false")).lower() == "true")
+		self.SCrecognizer = QtWidgets.QComboBox()
+		self.SCrecognizer.addItems(sorted(recognizerBackends))
+		self.SCrecognizer.setToolTip("templates: match ref_digits/, segments: sample seven-segment zones, external: helper processes running the command")
+		self.SCrecognizer.setCurrentText(self.qsettings.value("SCrecognizer", "templates"))
+		self.SCrecognizerCommand = QtWidgets.QLineEdit(self.qsettings.value("SCrecognizerCommand", _defaultRecognizerCommand))
+		self.SCrecognizerCommand.setToolTip("Helper command of the external recognizer, restarted when changed. The ssocr engine takes its own --ssocr-arguments, not the full-frame ssocr arguments below")
 		self.SCvideoCaptureIndex = QtWidgets.QLineEdit(self.qsettings.value("SCvideoCaptureIndex", '0'))
 		self.SCwaitKey = QtWidgets.QLineEdit(self.qsettings.value("SCwaitKey", '300'))
+		self.SCpreviewFPS = QtWidgets.QLineEdit(self.qsettings.value("SCpreviewFPS", '5'))
+		self.SCpreviewFPS.setToolTip("Preview updates per second, independent of the OCR rate. 0 turns the preview off")
+		self.previewVisible = True # Cleared by MainWindow while minimised
 		self.startSCOCRButton = QtWidgets.QPushButton("Start OCR")
 		self.startSCOCRButton.clicked.connect(self.init_SCOCRWorker)
 		self.terminateSCOCRButton = QtWidgets.QPushButton("Stop OCR")
@@ -191,11 +1091,13 @@ class Window(QtWidgets.QWidget):
 		self.terminate_SCOCRWorker()
 	
 	def initializeOCRCoordinatesList(self):
-		_loadedGCOCRCoordinates = self.qsettings.value("OCRcoordinates")
+		_loadedGCOCRCoordinates = self.qsettings.value("OCRcoordinates") or {}
 
 		for key, param in self.GCOCRCoordinates.items():
-			for index, qobj in enumerate(param):
-				qobj.setText(_loadedGCOCRCoordinates[key][index])
+			if key not in _loadedGCOCRCoordinates: # Region added since the settings were saved
+				continue
+			for qobj, value in zip(param, _loadedGCOCRCoordinates[key]):
+				qobj.setText(value)
 
 	def sendCommandToBrowser(self):
 		msg = {
@@ -222,10 +1124,17 @@ class Window(QtWidgets.QWidget):
 
 		if self.tickerRadioGroup.checkedId() == 0:
 			msg["ticker"] = self.tickerTextLineEdit.text()
+		elif self.tickerRadioGroup.checkedId() == 1:
+			if self.playerStats.refresh(): # athlete_data.csv was edited, teams may have changed
+				_team = self.tickerStatsTeam.currentText()
+				self.tickerStatsTeam.clear()
+				self.tickerStatsTeam.addItems(self.playerStats.teams)
+				self.tickerStatsTeam.setCurrentText(_team)
+			msg["ticker"] = self.playerStats.ticker(self.tickerStatsTeam.currentText(), self.tickerStatsNumber.text())
 
 
 		print(msg)
-		self.webSocketsWorker.send(json.dumps(msg));
+		self.webSocketsWorker.publish(msg)
 
 
 	def init_WebSocketsWorker(self):
@@ -234,60 +1143,50 @@ class Window(QtWidgets.QWidget):
 		self.webSocketsWorker.start()# Call to start WebSockets server
 
 	def init_SCOCRWorker(self):
-		self.SCOCRWorker = SCOCRWorker(self.returnOCRCoordinatesList(), self.SCssocrArguments.text(), self.SCwaitKey.text(), self.SCvideoCaptureIndex.text(), self.SCrotation.text(), self.SCerosion.text(), self.SCcropLeft.text(), self.SCcropTop.text())
-		self.SCOCRWorker.error.connect(self.close)
-		self.SCOCRWorker.recognizedDigits.connect(self.SCOCRhandler)
-		self.SCOCRWorker.processedFrameFlag.connect(lambda: self.CPUpercentage.setText('CPU: ' + str(psutil.cpu_percent()) + "%"))
-		self.SCOCRWorker.QImageFrame.connect(self.SCOCRPreviewImageHandler)
-		self.SCOCRWorker.run() # Call to start OCR openCV thread
+		self.terminate_SCOCRWorker() # Restart: stop the running worker and release its camera first
+		self.SCOCRWorker = SCOCRWorker(self.returnOCRCoordinatesList(), self.SCssocrArguments.text(), self.SCwaitKey.text(), self.SCvideoCaptureIndex.text(), self.SCrotation.text(), self.SCerosion.text(), self.SCcropLeft.text(), self.SCcropTop.text(), roiOnly=self.SCroiOnly.isChecked(), colourLUT=self.SCcolourLUT.isChecked(), previewFPS=self.SCpreviewFPS.text(), clockModel=self.SCclockModel.isChecked(), captureUnknown=self.SCcaptureUnknown.isChecked(), recognizer=self.SCrecognizer.currentText(), recognizerCommand=self.SCrecognizerCommand.text())
+		self.SCOCRWorker.previewVisible = self.previewVisible
+		self.SCOCRWorker.metrics = self.webSocketsWorker.metrics
+		self.SCOCRWorker.error.connect(self.close, QtCore.Qt.QueuedConnection)
+		self.SCOCRWorker.recognizedDigits.connect(self.SCOCRhandler, QtCore.Qt.QueuedConnection)
+		self.SCOCRWorker.processedFrameFlag.connect(self.CPUPercentageHandler, QtCore.Qt.QueuedConnection)
+		self.SCOCRWorker.previewFrames.connect(self.SCOCRPreviewImageHandler, QtCore.Qt.QueuedConnection)
+		self.SCOCRWorker.start() # Capture/OCR loop runs on its own thread, results arrive as queued signals
 
 	def terminate_SCOCRWorker(self):
-		self.SCOCRWorker.kill()
-		del(self.SCOCRWorker)
-
-	def SCOCRPreviewImageHandler(self, QImageFrame):
-		_pixmapRaw = QPixmap.fromImage(QImageFrame[0])
-		_pixmapProcessed = QPixmap.fromImage(QImageFrame[1])
-		self.previewImageRaw.setPixmap(_pixmapRaw.scaled(200, 200, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-		self.previewImageProcessed.setPixmap(_pixmapProcessed.scaled(200, 200, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-
-	def SCOCRhandler(self, digitDict): # Receives [self.digitL, self.digitR] from SCOCRWorker
-		self.GCOCRCoordinates["clock_1"][8].setText(str(digitDict["clock_1"]))
-		self.GCOCRCoordinates["clock_2"][8].setText(str(digitDict["clock_2"]))
-		self.GCOCRCoordinates["clock_3"][8].setText(str(digitDict["clock_3"]))
-		self.GCOCRCoordinates["clock_4"][8].setText(str(digitDict["clock_4"]))
-		self.GCOCRCoordinates["clock_colon"][8].setText(str(digitDict["clock_colon"]))
-		self.GCOCRCoordinates["shot_clock_1"][8].setText(str(digitDict["shot_clock_1"]))
-		self.GCOCRCoordinates["shot_clock_2"][8].setText(str(digitDict["shot_clock_2"]))
-		self.GCOCRCoordinates["shot_clock_decimal"][8].setText(str(digitDict["shot_clock_decimal"]))
-
-		msg_game = {
-			"shot_clock": digitDict["shot_clock"],
-			"clock": digitDict["clock"],
-		}
+		if self.SCOCRWorker is None:
+			return
+		if not self.SCOCRWorker.kill():
+			print("OCR worker still running after 5 s, waiting for it to release the camera")
+			self.SCOCRWorker.wait() # Dropping a running QThread would destroy it mid-frame
+		self.SCOCRWorker = None
 
-		packet = {
-			"game": msg_game
-		}
+	def CPUPercentageHandler(self, flag):
+		self.CPUpercentage.setText('CPU: ' + str(psutil.cpu_percent()) + "%")
+
+	def SCOCRPreviewImageHandler(self, previewFrames): # RGB arrays, already scaled to the preview size by SCOCRWorker
+		for label, frame in zip((self.previewImageRaw, self.previewImageProcessed), previewFrames):
+			_image = QImage(frame.data, frame.shape[1], frame.shape[0], frame.strides[0], QImage.Format_RGB888) # Wraps the array, no copy
+			label.setPixmap(QPixmap.fromImage(_image))
 
-		self.gameClock.setText(msg_game["clock"])
-		self.shotClock.setText(msg_game["shot_clock"])
-		self.webSocketsWorker.send(json.dumps(packet))
+	def setPreviewVisible(self, visible):
+		self.previewVisible = visible
+		if self.SCOCRWorker is not None:
+			self.SCOCRWorker.previewVisible = visible
+
+	def SCOCRhandler(self, digitDict): # Receives self.retOCRDigits from SCOCRWorker
+		for key, param in self.GCOCRCoordinates.items():
+			param[8].setText(str(digitDict.get(key, "")))
+
+		packet = gamePacket(digitDict)
+		self.gameClock.setText(packet["game"]["clock"])
+		self.shotClock.setText(packet["game"]["shot_clock"])
+		self.webSocketsWorker.publish(packet, digitDict.get("captured_at"))
 
 	def returnOCRCoordinatesList(self): # Returns 1:1 copy of self.GCOCRCoordinates without QObjects
-		response = {
-			"clock_1": ["", "", "", "", "", "", "", "", ""],
-			"clock_2": ["", "", "", "", "", "", "", "", ""],
-			"clock_3": ["", "", "", "", "", "", "", "", ""],
-			"clock_4": ["", "", "", "", "", "", "", "", ""],
-			"clock_colon": ["", "", "", "", "", "", "", "", ""],
-			"shot_clock_1": ["", "", "", "", "", "", "", "", ""],
-			"shot_clock_2": ["", "", "", "", "", "", "", "", ""],
-			"shot_clock_decimal": ["", "", "", "", "", "", "", "", ""]
-		}
+		response = {}
 		for key, param in self.GCOCRCoordinates.items():
-			for index, qobj in enumerate(param):
-				response[key][index] = qobj.text()
+			response[key] = [qobj.text() for qobj in param]
 
 		return response
 		
@@ -297,7 +1196,7 @@ class Window(QtWidgets.QWidget):
 
 		self.tickerRadioGroup.setExclusive(True)
 		self.tickerRadioGroup.addButton(self.tickerTextRadio, 0)
-		#self.tickerRadioGroup.addButton(self.tickerStatsRadio, 1)
+		self.tickerRadioGroup.addButton(self.tickerStatsRadio, 1)
 		self.tickerRadioGroup.button(0).setChecked(True)
 
 		grid = QtWidgets.QGridLayout()
@@ -305,8 +1204,10 @@ class Window(QtWidgets.QWidget):
 		grid.setVerticalSpacing(10)
 		grid.addWidget(self.tickerTextRadio, 2, 0)
 		grid.addWidget(self.tickerTextLineEdit, 3, 0, 1, 2)
-		grid.addWidget(self.gameOverCheckBox, 4, 0)
-		#grid.addWidget(self.tickerStatsRadio, 4, 0)
+		grid.addWidget(self.tickerStatsRadio, 4, 0)
+		grid.addWidget(self.tickerStatsTeam, 5, 0)
+		grid.addWidget(self.tickerStatsNumber, 5, 1)
+		grid.addWidget(self.gameOverCheckBox, 6, 0)
 
 		groupBox.setLayout(grid)
 		return groupBox
@@ -350,8 +1251,15 @@ class Window(QtWidgets.QWidget):
 		self.qsettings.setValue("SCerosion", self.SCerosion.text())
 		self.qsettings.setValue("TCrop", self.SCcropTop.text())
 		self.qsettings.setValue("LCrop", self.SCcropLeft.text())
+		self.qsettings.setValue("SCroiOnly", "true" if self.SCroiOnly.isChecked() else "false")
+		self.qsettings.setValue("SCcolourLUT", "true" if self.SCcolourLUT.isChecked() else "false")
+		self.qsettings.setValue("SCclockModel", "true" if self.SCclockModel.isChecked() else "false")
+		self.qsettings.setValue("SCcaptureUnknown", "true" if self.SCcaptureUnknown.isChecked() else "false")
+		self.qsettings.setValue("SCrecognizer", self.SCrecognizer.currentText())
+		self.qsettings.setValue("SCrecognizerCommand", self.SCrecognizerCommand.text())
 		self.qsettings.setValue("SCwaitKey", self.SCwaitKey.text())
 		self.qsettings.setValue("SCvideoCaptureIndex", self.SCvideoCaptureIndex.text())
+		self.qsettings.setValue("SCpreviewFPS", self.SCpreviewFPS.text())
 		
 		try:
 			self.SCOCRWorker.importOCRCoordinates(self.returnOCRCoordinatesList())
@@ -360,7 +1268,13 @@ class Window(QtWidgets.QWidget):
 			self.SCOCRWorker.erosion = int(self.SCerosion.text())
 			self.SCOCRWorker.cropLeft = int(self.SCcropLeft.text())
 			self.SCOCRWorker.cropTop = int(self.SCcropTop.text())
+			self.SCOCRWorker.roiOnly = self.SCroiOnly.isChecked()
+			self.SCOCRWorker.colourLUT = self.SCcolourLUT.isChecked()
+			self.SCOCRWorker.setClockModel(self.SCclockModel.isChecked())
+			self.SCOCRWorker.setCaptureUnknown(self.SCcaptureUnknown.isChecked())
+			self.SCOCRWorker.setRecognizer(self.SCrecognizer.currentText(), self.SCrecognizerCommand.text())
 			self.SCOCRWorker.waitKey = self.SCwaitKey.text()
+			self.SCOCRWorker.setPreviewFPS(self.SCpreviewFPS.text())
 		except:
 			pass
 
@@ -417,23 +1331,9 @@ class Window(QtWidgets.QWidget):
 
 
 
-		for index, qobj in enumerate(self.GCOCRCoordinates["clock_1"]):
-			grid.addWidget(qobj, 2, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["clock_2"]):
-			grid.addWidget(qobj, 3, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["clock_3"]):
-			grid.addWidget(qobj, 4, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["clock_4"]):
-			grid.addWidget(qobj, 5, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["clock_colon"]):
-			grid.addWidget(qobj, 6, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["shot_clock_1"]):
-			grid.addWidget(qobj, 17, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["shot_clock_2"]):
-			grid.addWidget(qobj, 18, index)
-		for index, qobj in enumerate(self.GCOCRCoordinates["shot_clock_decimal"]):
-			grid.addWidget(qobj, 19, index)
-
+		for row, param in enumerate(self.GCOCRCoordinates.values()):
+			for index, qobj in enumerate(param):
+				grid.addWidget(qobj, 2 + row, index)
 
 		grid.setColumnMinimumWidth(1, 30)
 		grid.setColumnMinimumWidth(2, 30)
@@ -457,6 +1357,8 @@ class Window(QtWidgets.QWidget):
 		grid.addWidget(QtWidgets.QLabel("Left Crop"), 0, 3, 1, 1)
 		grid.addWidget(QtWidgets.QLabel("WaitKey"), 2, 0)
 		grid.addWidget(QtWidgets.QLabel("Webcam Index"), 2, 1)
+		grid.addWidget(self.SCroiOnly, 2, 2)
+		grid.addWidget(self.SCcolourLUT, 2, 3)
 		grid.addWidget(self.SCrotation, 1, 0, 1, 1)
 		grid.addWidget(self.SCerosion, 1, 1, 1, 1)
 		grid.addWidget(self.SCcropTop, 1, 2, 1, 1)
@@ -465,14 +1367,30 @@ class Window(QtWidgets.QWidget):
 		grid.addWidget(self.SCvideoCaptureIndex, 3, 1)
 		grid.addWidget(self.startSCOCRButton, 3, 2)
 		grid.addWidget(self.terminateSCOCRButton, 3, 3)
+		grid.addWidget(QtWidgets.QLabel("Preview FPS"), 4, 0)
+		grid.addWidget(self.SCpreviewFPS, 4, 1)
+		grid.addWidget(self.SCclockModel, 4, 2)
+		grid.addWidget(self.SCcaptureUnknown, 4, 3)
+		grid.addWidget(QtWidgets.QLabel("Recognizer"), 5, 0)
+		grid.addWidget(self.SCrecognizer, 5, 1)
+		grid.addWidget(self.SCrecognizerCommand, 5, 2, 1, 2)
+		grid.addWidget(QtWidgets.QLabel("ssocr Arguments"), 6, 0)
+		grid.addWidget(self.SCssocrArguments, 6, 1, 1, 3)
 
 		self.SCssocrArguments.editingFinished.connect(self.widthHeightAutoFiller)
 		self.SCrotation.editingFinished.connect(self.widthHeightAutoFiller)
 		self.SCerosion.editingFinished.connect(self.widthHeightAutoFiller)
 		self.SCwaitKey.editingFinished.connect(self.widthHeightAutoFiller)
+		self.SCpreviewFPS.editingFinished.connect(self.widthHeightAutoFiller)
 		self.SCvideoCaptureIndex.editingFinished.connect(self.widthHeightAutoFiller)
 		self.SCcropLeft.editingFinished.connect(self.widthHeightAutoFiller)
 		self.SCcropTop.editingFinished.connect(self.widthHeightAutoFiller)
+		self.SCroiOnly.stateChanged.connect(self.widthHeightAutoFiller)
+		self.SCcolourLUT.stateChanged.connect(self.widthHeightAutoFiller)
+		self.SCclockModel.stateChanged.connect(self.widthHeightAutoFiller)
+		self.SCcaptureUnknown.stateChanged.connect(self.widthHeightAutoFiller)
+		self.SCrecognizer.currentIndexChanged.connect(self.widthHeightAutoFiller)
+		self.SCrecognizerCommand.editingFinished.connect(self.widthHeightAutoFiller)
 
 		grid.setColumnStretch(0,50)
 		grid.setColumnStretch(1,25)
@@ -530,9 +1448,28 @@ class WebSocketsWorker(QtCore.QThread):
 	socket_opened = QtCore.Signal(int)
 
 	class BroadcastServerProtocol(WebSocketServerProtocol):
+		def onConnect(self, request):
+			self.binary = _gameFrameProtocol in request.protocols # Clocks as encodeGameFrame, everything else JSON
+			return _gameFrameProtocol if self.binary else None
+
 		def onOpen(self):
+			self.paused = False # Set while more than factory.clientBufferLimit bytes wait on the transport
+			self.stale = False # Missed updates while paused, gets the full state when it drains
+			self.transport.bufferSize = self.factory.clientBufferLimit
+			self.registerProducer(self, True) # Transport calls pause/resumeProducing around bufferSize
 			self.factory.register(self)
 
+		def pauseProducing(self):
+			self.paused = True
+
+		def resumeProducing(self):
+			self.paused = False
+			if self.stale:
+				self.factory.sendState(self)
+
+		def stopProducing(self):
+			self.paused = True
+
 		def onMessage(self, payload, isBinary):
 			if not isBinary:
 				msg = "{} from {}".format(payload.decode('utf8'), self.peer)
@@ -542,10 +1479,12 @@ class WebSocketsWorker(QtCore.QThread):
 			WebSocketServerProtocol.connectionLost(self, reason)
 			self.factory.unregister(self)
 
-	class BroadcastServerFactory(WebSocketServerFactory):
-		def __init__(self, url, debug=False, debugCodePaths=False):
+	class BroadcastServerFactory(ScoreboardBroadcast, WebSocketServerFactory):
+		def __init__(self, url, debug=False, debugCodePaths=False, deflate=True):
 			WebSocketServerFactory.__init__(self, url)
-			self.clients = []
+			ScoreboardBroadcast.__init__(self)
+			if deflate: # JSON messages are compressed for clients that offer it, clock frames never are
+				self.setProtocolOptions(perMessageCompressionAccept=lambda offers: next((PerMessageDeflateOfferAccept(offer) for offer in offers if isinstance(offer, PerMessageDeflateOffer)), None))
 			self.tickcount = 0
 			#self.tick()
 
@@ -554,31 +1493,33 @@ class WebSocketsWorker(QtCore.QThread):
 			self.broadcast("tick %d from server" % self.tickcount)
 			reactor.callLater(0.5, self.tick)
 
-		def register(self, client):
-			if client not in self.clients:
-				print(("registered client {}".format(client.peer)))
-				self.clients.append(client)
+		def publishTick(self):
+			self.publish()
+			reactor.callLater(self.publishInterval, self.publishTick)
 
-		def unregister(self, client):
-			if client in self.clients:
-				print(("unregistered client {}".format(client.peer)))
-				self.clients.remove(client)
 
-		def broadcast(self, msg):
-			#print("broadcasting message '{}' ..".format(msg))
-			for c in self.clients:
-				c.sendMessage(msg.encode('utf8'))
-				#print("message {} sent to {}".format(msg, c.peer))
+	class AssetResource(OverlayAssets, Resource):
+		"""OverlayAssets as the root resource of the :8080 site."""
+		def __init__(self, root=_applicationPath, checkInterval=1.0):
+			Resource.__init__(self)
+			OverlayAssets.__init__(self, root, checkInterval)
 
-		def returnClients(self):
-			return
-			#for c in self.clients:
-				#print(c.peer)
+		def getChild(self, name, request):
+			return self # Renders by request.path, children like /metrics are matched first
+
+	class MetricsResource(MetricsPage, Resource):
+		isLeaf = True
 
+		def __init__(self, metrics):
+			Resource.__init__(self)
+			MetricsPage.__init__(self, metrics)
 
-	def __init__(self):
+	def __init__(self, feedURL=_scoreboardFeedURL):
 		QtCore.QThread.__init__(self)
 		self.factory = self.BroadcastServerFactory("ws://localhost:9000", debug=False, debugCodePaths=False)
+		self.feed = ScoreboardFeedPoller(self.factory.queue, feedURL) # Follows the gameID published by the GUI
+		self.assets = self.AssetResource()
+		self.metrics = serverMetrics(self.factory, self.feed, self.assets) # Served as /metrics, shared with SCOCRWorker
 
 	def run(self):
 		self.factory.protocol = self.BroadcastServerProtocol
@@ -586,332 +1527,843 @@ class WebSocketsWorker(QtCore.QThread):
 			 listenWS(self.factory)
 		except:
 			self.error.emit("Fail")
-		webdir = File(_applicationPath)
-		webdir.indexNames = ['index.php', 'index.html']
-		web = Site(webdir)
+		self.assets.refresh() # Build before the first request
+		self.assets.putChild(b"metrics", self.MetricsResource(self.metrics))
+		web = Site(self.assets)
 		try:
 			reactor.listenTCP(8080, web)
 			self.socket_opened.emit(1)
 		except: 
 			self.error.emit("Fail")
+		reactor.callWhenRunning(self.factory.publishTick)
+		self.feed.start()
 		reactor.run(installSignalHandlers=0)
 
-	def send(self, data):
-		reactor.callFromThread(self.factory.broadcast, data)
+	def stop(self):
+		self.feed.close()
+		reactor.callFromThread(reactor.stop)
+
+	def publish(self, update, capturedAt=None):
+		"""Queues a nested dict update. The reactor sends only the changed fields, once per publishInterval."""
+		if "gameID" in update:
+			self.feed.setGameID(update["gameID"])
+		self.factory.queue(update, capturedAt)
 		self.updateProgress.emit([self.factory.returnClients()])
 
+	def send(self, data):
+		self.publish(json.loads(data))
+
+
+class FrameGrabber(QtCore.QThread):
+	"""Reads frames from a cv2.VideoCapture on its own thread into a small ring buffer.
+	latest() hands out the newest frame only, frames nobody took are counted as dropped.
+	The slot being read by the OCR loop is never overwritten, so no frame is copied.
+	"""
+	def __init__(self, cam, slots=3, interval=0):
+		QtCore.QThread.__init__(self)
+		self.cam = cam
+		self.interval = interval # Seconds between reads for video files, 0 for live cameras
+		self.buffers = [None] * max(slots, 3) # Writing, latest and held slot
+		width, height = int(cam.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cam.get(cv2.CAP_PROP_FRAME_HEIGHT))
+		if width > 0 and height > 0:
+			self.buffers = [numpy.empty((height, width, 3), numpy.uint8) for slot in self.buffers]
+		self.timestamps = [0.0] * len(self.buffers)
+		self.latestSlot = None
+		self.heldSlot = None
+		self.sequence = 0 # Frames written
+		self.delivered = 0 # Sequence number of the last frame handed out
+		self.framesCaptured = 0
+		self.framesDropped = 0
+		self.exhausted = False # Set when the capture stops delivering frames
+		self._isRunning = False
+		self._releaseOnExit = False
+		self._condition = threading.Condition()
+
+	def run(self):
+		self._isRunning = True
+		while self._isRunning:
+			with self._condition:
+				slot = [index for index in range(len(self.buffers)) if index != self.latestSlot and index != self.heldSlot][0]
+
+			if self.buffers[slot] is None:
+				success, frame = self.cam.read()
+			else:
+				success, frame = self.cam.read(self.buffers[slot]) # Reuses the slot when the size matches
+			if not success:
+				break
+
+			with self._condition:
+				self.buffers[slot] = frame
+				self.timestamps[slot] = time.time()
+				self.latestSlot = slot
+				self.sequence += 1
+				self.framesCaptured += 1
+				self._condition.notify_all()
+
+			if self.interval:
+				time.sleep(self.interval)
+
+		with self._condition:
+			self.exhausted = True
+			self._condition.notify_all()
+			release = self._releaseOnExit
+		if release:
+			self.cam.release()
+
+	def latest(self, timeout=None):
+		"""Waits for a frame newer than the last one handed out and returns (frame, capture time),
+		or None on timeout or when capture has stopped. Releases the previously returned frame.
+		"""
+		with self._condition:
+			self.heldSlot = None
+			self._condition.wait_for(lambda: self.sequence > self.delivered or self.exhausted, timeout)
+			if self.sequence <= self.delivered:
+				return None
+			self.framesDropped += self.sequence - self.delivered - 1
+			self.delivered = self.sequence
+			self.heldSlot = self.latestSlot
+			return self.buffers[self.heldSlot], self.timestamps[self.heldSlot]
+
+	def stop(self):
+		self._isRunning = False
+
+	def releaseOnExit(self):
+		"""Hands the camera over to the grabber, which releases it once its blocked read returns.
+		Returns False when the loop already ended and the caller has to release it.
+		"""
+		with self._condition:
+			if self.exhausted:
+				return False
+			self._releaseOnExit = True
+			_blockedGrabbers[:] = [grabber for grabber in _blockedGrabbers if not grabber.isFinished()] + [self]
+			return True
+
+_blockedGrabbers = [] # FrameGrabbers still inside cam.read() after their worker ended, kept until they finish
+
 
 class SCOCRWorker(QtCore.QThread):
 	error = QtCore.Signal(int)
 	recognizedDigits = QtCore.Signal(dict)
-	QImageFrame = QtCore.Signal(list)
+	previewFrames = QtCore.Signal(list)
 	processedFrameFlag = QtCore.Signal(int)
 
-	def __init__(self, OCRCoordinatesList, ssocrArguments, waitKey, videoCaptureIndex, rotation, erosion, cropLeft, cropTop):
+	def __init__(self, OCRCoordinatesList, ssocrArguments, waitKey, videoCaptureIndex, rotation, erosion, cropLeft, cropTop, roiOnly=False, colourLUT=False, preview=True, previewFPS=5, clockModel=False, captureUnknown=False, recognizer="templates", recognizerCommand=""):
 		QtCore.QThread.__init__(self)
 
 		self.ssocrArguments = ssocrArguments
 		self.waitKey = waitKey
-		self.coords = OCRCoordinatesList
+		self.regionConfig = RegionConfig(OCRCoordinatesList) # Replaced whole by importOCRCoordinates()
 		self.videoCaptureIndex = videoCaptureIndex
 		self.rotation = int(rotation)
 		self.erosion = int(erosion)
 		self.cropLeft = int(cropLeft)
 		self.cropTop = int(cropTop)
+		self.roiOnly = roiOnly # Preprocess only the window around the bounding boxes
+		self.colourLUT = colourLUT # Threshold colours with a ColourMaskTable instead of HSV + inRange
+		self.preview = preview # Draw and show the debug windows and Qt preview; off when headless
+		self.clockScheduler = ClockScheduler() if clockModel else None # Read only the digits expected to change
+		self.setPreviewFPS(previewFPS)
+		self.previewWidth = 200 # Width of the frames sent to the Qt preview
+		self.previewVisible = True # Cleared by the GUI while minimised, no preview work at all then
+		self._lastPreview = 0.0
+		self.hsvRanges = ScoreboardHSVRanges
+		self._geometry = None # Cached crop + rotation transform, see frameGeometry()
+		self._geometryKey = None
+		self._roiPlan = None # Cached ROI-only windows and maps, see roiPlan()
+		self._roiPlanKey = None
 		self.mouse_coordinates = [0, 0]
-		self.referenceDigits = None
+		self.recognizer = None # Recognizer backend reading the digit regions, see setRecognizer()
+		self.nextRecognizer = (None, None) # ((name, command), backend) installed by the loop before its next frame
 		self.cam = None # VideoCapture object, created in run()
+		self.grabber = None # FrameGrabber reading self.cam, created in run()
+		self.frameAge = 0.0 # Seconds between capture and processing of the last frame
+		self._isRunning = True # Cleared by kill(), checked once per frame
+		self._previewWindows = False
 		
-		self.loadReferenceMatrices()
-		self.retOCRDigits  = {
-			"clock_1": "",
-			"clock_2": "",
-			"clock_3": "",
-			"clock_4": "",
-			"clock_colon": "",
-			"shot_clock_1": "",
-			"shot_clock_2": "",
-			"shot_clock_decimal": ""
-		}
+		self.retOCRDigits = dict((key, "") for key, label, kind in OCRRegions)
+		self.regionMeans = {} # Mean brightness of the "mean" regions in the last frame
+		self.regionCrops = {} # Autocropped digit regions, kept while a region is unchanged
+		self.regionGlyphs = {} # Inverted 5x7 glyph per digit region, as matched
+		self.regionFingerprints = {} # (rect, hash of the processed ROI) per region, see recognizeRegions()
+		self.fingerprintHits = dict((key, 0) for key, label, kind in OCRRegions) # Regions skipped as unchanged
+		self.fingerprintMisses = dict((key, 0) for key, label, kind in OCRRegions) # Regions read again
+		self.lastPublished = None # (clock, shot_clock) last sent with recognizedDigits
+		self.emittedResults = 0
+		self.suppressedResults = 0 # Frames whose clocks matched the last emission
+		self.debugRegion = "clock_3" # Region shown in the "Test 1" / "Test 2" windows
+		self.stageTimes = None # Seconds per pipeline stage of the last frame when set to a dict, see markStage()
+		self._stageMark = 0.0
+		self.retOCRDistances = {} # Hamming distance of the last match per digit region
+		self.recognitionMisses = dict((key, 0) for key, label, kind in OCRRegions if kind == "digit") # Readings rejected by the recognizer's maxDistance
+		self.framesProcessed = 0
+		self.metrics = None # MetricsRegistry to record into, set before start()
+		self.glyphStore = None # GlyphCaptureStore for glyphs without an exact reference
+		self.setCaptureUnknown(captureUnknown)
+		self.setRecognizer(recognizer, recognizerCommand)
+		self.swapRecognizer()
 
 	def mouse_hover_coordinates(self, event, x, y, flags, param):
 		if event == EVENT_MOUSEMOVE:
 			self.mouse_coordinates = [x, y]
 
-	def loadReferenceMatrices(self):
-		self.referenceDigits = [
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/0A.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/0B.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/0C.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/0D.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/0E.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_1.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_2.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_3.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_4.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_5.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_6.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_7.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_8.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_9.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_10.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_11.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_12.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_13.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_14.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_15.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_16.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_17.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_18.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_19.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_20.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_21.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_22.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_23.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_24.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_25.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_26.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_27.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_28.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_29.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_30.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_31.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_32.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_33.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_34.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_35.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_36.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_37.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_38.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_39.png'), 0),
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_40.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_41.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_42.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_43.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_44.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_45.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_46.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_47.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_48.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_49.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_50.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_51.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/1_52.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/2A.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/2B.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/2C.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/2D.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/3A.png'), 0) 
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/4A.png'), 0) 
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/5A.png'), 0) 
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/6A.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/6B.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/6C.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/6D.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/6E.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/6F.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/7A.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/7B.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/8A.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9A.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9B.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9C.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9D.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9E.png'), 0), 
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9F.png'), 0),
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/9G.png'), 0)
-			],
-			[
-			cv2.imread(os.path.join(_applicationPath, 'ref_digits/blank.png'), 0)
-			]
-		]
 	def importOCRCoordinates(self, OCRCoordinatesList):
-		self.coords = OCRCoordinatesList
+		"""Compiles the boxes edited in the GUI, the loop picks them up at its next frame."""
+		self.regionConfig = RegionConfig(OCRCoordinatesList)
+
+	def frameGeometry(self, frameRows, frameCols):
+		"""Returns the crop + rotation transform for a frameCols x frameRows frame as
+		(rows, cols, rotationMap): the cropped size and the fixed-point (CV_16SC2) cv2.remap map
+		rotating it by self.rotation around its centre, nearest-neighbour (None without rotation).
+		Rebuilt only when the frame size, rotation or crop changes.
+		"""
+		_key = (frameRows, frameCols, self.rotation, self.cropLeft, self.cropTop)
+		if self._geometryKey != _key:
+			rows, cols = frameRows - self.cropTop, frameCols - self.cropLeft # Negative crops pad instead
+			rotationMap = None
+			if self.rotation != 0:
+				M = cv2.invertAffineTransform(cv2.getRotationMatrix2D((cols/2,rows/2), self.rotation, 1))
+				gridX, gridY = numpy.meshgrid(numpy.arange(cols, dtype=numpy.float64), numpy.arange(rows, dtype=numpy.float64))
+				mapX = (M[0,0]*gridX + M[0,1]*gridY + M[0,2]).astype(numpy.float32)
+				mapY = (M[1,0]*gridX + M[1,1]*gridY + M[1,2]).astype(numpy.float32)
+				rotationMap = cv2.convertMaps(mapX, mapY, cv2.CV_16SC2, nninterpolation=True)[0] # Rounded source pixels, 4 bytes each
+			self._geometry = (rows, cols, rotationMap)
+			self._geometryKey = _key
+		return self._geometry
+
+	def croppedWindow(self, img, y0, y1, x0, x1):
+		"""Returns rows y0:y1, columns x0:x1 of the cropped frame without building it.
+		This is a view of img, padded with white only where a negative crop reaches past the frame edge.
+		"""
+		sy0, sx0 = y0 + self.cropTop, x0 + self.cropLeft
+		padTop, padLeft = max(-sy0, 0), max(-sx0, 0)
+		if padTop >= y1 - y0 or padLeft >= x1 - x0: # Entirely inside the padding
+			return numpy.full((y1 - y0, x1 - x0, 3), 255, numpy.uint8)
+		window = img[max(sy0, 0):y1 + self.cropTop, max(sx0, 0):x1 + self.cropLeft]
+		if padTop or padLeft:
+			window = cv2.copyMakeBorder(window, padTop, 0, padLeft, 0, cv2.BORDER_CONSTANT, value=[255,255,255])
+		return window
+
+	def roiPlan(self, inner, rows, cols, rotationMap):
+		"""Returns the ROI-only windows for the bounding box union inner = (y0, y1, x0, x1):
+		(window, source, rotationMap) with the processing window (inner plus an erosion margin),
+		the source window it samples from and the remap map shifted onto that source window.
+		Cached until the geometry, the boxes or the erosion change.
+		"""
+		_key = (self._geometryKey, inner, self.erosion)
+		if self._roiPlanKey != _key:
+			margin = self.erosion + 1 # Erosion reads neighbours, keep them inside the window
+			y0, y1, x0, x1 = max(inner[0] - margin, 0), min(inner[1] + margin, rows), max(inner[2] - margin, 0), min(inner[3] + margin, cols)
+			source = (y0, y1, x0, x1)
+			if rotationMap is not None:
+				rotationMap = rotationMap[y0:y1, x0:x1]
+				sx0, sx1 = max(int(rotationMap[..., 0].min()), 0), min(int(rotationMap[..., 0].max()) + 1, cols)
+				sy0, sy1 = max(int(rotationMap[..., 1].min()), 0), min(int(rotationMap[..., 1].max()) + 1, rows)
+				if sx1 <= sx0 or sy1 <= sy0: # Window rotated entirely off the source: border value only
+					source = None
+				else:
+					source = (sy0, sy1, sx0, sx1)
+					rotationMap = rotationMap - numpy.array([sx0, sy0], numpy.int16) # Whole pixels, the same samples as the full frame
+			self._roiPlan = ((y0, y1, x0, x1), source, rotationMap)
+			self._roiPlanKey = _key
+		return self._roiPlan
+
+	def colourMask(self, img_window, rotationMap=None):
+		"""Rotates a BGR window (when a map is given) and thresholds the scoreboard colours:
+		0 where a segment is lit, 255 elsewhere. Rotation is nearest-neighbour, so every output
+		pixel is the HSV reading of one source pixel; with colourLUT set the HSV conversion and
+		inRange passes are replaced by one ColourMaskTable lookup on the source pixels and only
+		the mask is rotated, which gives the same pixels.
+		"""
+		if self.colourLUT:
+			th3 = colourMaskTable(self.hsvRanges).mask(img_window)
+			self.markStage("colour")
+			if rotationMap is not None:
+				th3 = cv2.remap(th3, rotationMap, None, cv2.INTER_NEAREST, borderMode=cv2.BORDER_CONSTANT, borderValue=255)
+				self.markStage("rotation")
+			return th3
+
+		img_HSV = cv2.cvtColor(img_window, cv2.COLOR_BGR2HSV)
+		self.markStage("colour")
+		if rotationMap is not None:
+			img_HSV = cv2.remap(img_HSV, rotationMap, None, cv2.INTER_NEAREST) # Black border, not a scoreboard colour
+			self.markStage("rotation")
+		th3 = hsvMask(img_HSV, self.hsvRanges)
+		self.markStage("colour")
+		return th3
+
+	def preprocessFrame(self, img, regions=None):
+		"""Crops, rotates and colour-thresholds a BGR frame, returns the eroded binary image.
+		With roiOnly set, only the source pixels that the bounding boxes (plus an erosion
+		margin) map back to are converted; the boxes come out identical to the full-frame
+		path and everything outside them is left white. regions is the frame's RegionConfig.
+		"""
+		rows, cols, rotationMap = self.frameGeometry(img.shape[0], img.shape[1])
+		inner = (regions or self.regionConfig).clipped(rows, cols)[2] if self.roiOnly else None
+
+		##### FULL FRAME: CROP, ROTATION, COLOUR THRESHOLD, EROSION ######
+		if inner is None:
+			img_window = self.croppedWindow(img, 0, rows, 0, cols)
+			self.markStage("crop")
+			th3 = cv2.erode(self.colourMask(img_window, rotationMap), _erosionKernel, iterations = self.erosion)
+			self.markStage("erode")
+			return th3
+
+		##### ROI ONLY: SAME STEPS ON THE SOURCE WINDOW BEHIND THE BOUNDING BOXES ######
+		(y0, y1, x0, x1), source, rotationMap = self.roiPlan(inner, rows, cols, rotationMap)
+		if source is None: # Rotated entirely off the source, only border pixels
+			th3 = numpy.full((y1 - y0, x1 - x0), 255, numpy.uint8)
+		else:
+			img_window = self.croppedWindow(img, *source)
+			self.markStage("crop")
+			th3 = self.colourMask(img_window, rotationMap)
+		th3 = cv2.erode(th3, _erosionKernel, iterations = self.erosion)
+		self.markStage("erode")
+
+		img_processed = numpy.full((rows, cols), 255, numpy.uint8)
+		img_processed[inner[0]:inner[1], inner[2]:inner[3]] = th3[inner[0] - y0:inner[1] - y0, inner[2] - x0:inner[3] - x0]
+		self.markStage("roi")
+		return img_processed
+
+	def regionRect(self, key): # Returns (TL X, TL Y, BR X, BR Y) of a region, 0 for empty fields
+		return self.regionConfig.rect(key)
+
+	def recognizeRegions(self, img_processed, keys=None, regions=None):
+		"""Reads the regions of OCRRegions (only those in keys, if given) from the processed frame
+		in one pass. Regions whose pixels are the same as when they were last read keep their reading.
+		The others are given to the recognizer backend together. Empty regions keep their last value.
+		regions is the frame's RegionConfig, the current one if not given.
+		"""
+		boxes, missing, window = (regions or self.regionConfig).clipped(*img_processed.shape[:2])
+		for key in missing:
+			self.regionFingerprints.pop(key, None)
+			self.regionCrops.pop(key, None)
+			self.regionGlyphs.pop(key, None)
+
+		digitRegions = []
+		recognizer = self.recognizer
+		for key, kind, rect, slices in boxes:
+			if keys is not None and key not in keys:
+				continue
+			region = img_processed[slices]
+
+			##### SKIP REGIONS WHOSE BINARY PIXELS DID NOT CHANGE #####
+			fingerprint = (rect, hash(region.tobytes()))
+			if self.regionFingerprints.get(key) == fingerprint:
+				self.fingerprintHits[key] += 1
+				self.markStage("roi")
+				continue
+			self.fingerprintMisses[key] += 1
+
+			if kind == "mean":
+				self.regionFingerprints[key] = fingerprint
+				self.regionMeans[key] = region.mean()
+				self.retOCRDigits[key] = str(self.regionMeans[key])[:3]
+			else:
+				digitRegions.append((key, rect, region, fingerprint))
+			self.markStage("roi")
+
+		if not digitRegions:
+			return
 
-	def kill(self):
+		results = recognizer.recognize(img_processed, [(key, rect, region) for key, rect, region, fingerprint in digitRegions], self.markStage)
+		store = self.glyphStore
+		for index, ((key, rect, region, fingerprint), (label, distance)) in enumerate(zip(digitRegions, results)):
+			self.retOCRDistances[key] = distance
+			if recognizer.glyphs is not None:
+				self.regionCrops[key] = recognizer.crops[index]
+				self.regionGlyphs[key] = recognizer.glyphs[index]
+				if store is not None and distance > 0:
+					store.add(recognizer.codes[index], recognizer.glyphs[index], label, distance, key)
+			if(distance <= recognizer.maxDistance): # Too far from every known pattern: keep the last reading
+				self.retOCRDigits[key] = label
+				self.regionFingerprints[key] = fingerprint # Only skip pixels that were actually read
+			else:
+				self.recognitionMisses[key] += 1
+		self.markStage("match")
+
+	def recognizeScheduled(self, img_processed, regions=None):
+		"""Reads the mean regions, then only the digit regions that clockScheduler expects to
+		change, cascading to higher digits on a rollover. Reads everything without a scheduler.
+		regions is the frame's RegionConfig, the current one if not given.
+		"""
+		regions = regions or self.regionConfig
+		scheduler = self.clockScheduler
+		if scheduler is None:
+			return self.recognizeRegions(img_processed, None, regions)
+
+		now = time.time()
+		digitKeys = _digitKeys
+		self.recognizeRegions(img_processed, _meanKeys, regions)
+		modes, chains = scheduler.chains(self.regionMeans)
+
+		##### FIRST FRAME OR DISPLAY MODE CHANGED: READ EVERY DIGIT #####
+		if modes != scheduler.modes:
+			scheduler.modes = modes
+			scheduler.fullReads += 1
+			self.recognizeRegions(img_processed, digitKeys, regions)
+			scheduler.lastRead.update((key, now) for key in digitKeys)
+			return
+
+		##### LOWEST DIGITS AND DUE VERIFICATIONS, THEN DIGITS ABOVE A ROLLOVER #####
+		verify = set(key for chain in chains for key in chain[1:] if scheduler.due(key, now))
+		scheduler.verifyReads += len(verify)
+		pending = set(chain[0] for chain in chains) | verify
+		read = set()
+		while pending:
+			before = dict((key, self.retOCRDigits[key]) for key in pending)
+			self.recognizeRegions(img_processed, pending, regions)
+			read |= pending
+			pending = set()
+			expected = set()
+			for chain in chains:
+				for lower, key in zip(chain, chain[1:]):
+					if lower in before and scheduler.rolledOver(before[lower], self.retOCRDigits[lower]):
+						expected.add(key)
+						if key not in read:
+							pending.add(key)
+			scheduler.predictedReads += len(pending)
+			if any(key in verify and key not in expected and before[key] != self.retOCRDigits[key] for key in before):
+				scheduler.disagreements += 1 # The model is off: read the rest of this frame too
+				scheduler.fullReads += 1
+				pending |= digitKeys - read
+				verify = set()
+
+		scheduler.lastRead.update((key, now) for key in read)
+		scheduler.skippedReads += len(digitKeys - read)
+
+	def setClockModel(self, enabled):
+		if enabled and self.clockScheduler is None:
+			self.clockScheduler = ClockScheduler()
+		elif not enabled:
+			self.clockScheduler = None
+
+	def setRecognizer(self, name, command=""):
+		"""Queues the recognizer backend name (see recognizerBackends), the loop switches to it
+		at its next frame. A backend queued but never installed holds nothing to close.
+		"""
+		if (name, command) == self.nextRecognizer[0]:
+			return
+		self.nextRecognizer = ((name, command), createRecognizer(name, command))
+
+	def swapRecognizer(self):
+		"""Installs the backend queued by setRecognizer and closes the last one. Called on the
+		loop's thread between frames, so a backend is never closed while it is reading.
+		"""
+		recognizer = self.nextRecognizer[1]
+		if recognizer is self.recognizer:
+			return
+		recognizer, self.recognizer = self.recognizer, recognizer
+		self.regionFingerprints.clear() # Read every region again with the new backend
+		if recognizer is not None:
+			recognizer.close()
+
+	def setCaptureUnknown(self, enabled):
+		if enabled and self.glyphStore is None:
+			self.glyphStore = GlyphCaptureStore()
+			self.glyphStore.start()
+		elif not enabled and self.glyphStore is not None:
+			store, self.glyphStore = self.glyphStore, None
+			store.close()
+
+	def formatClocks(self):
+		_digits = self.retOCRDigits
+		if(self.regionMeans.get("clock_colon", 0) < 100): # If has colon
+			_digits["clock"] = str(_digits["clock_1"]) + str(_digits["clock_2"]) + ":" + str(_digits["clock_3"]) + str(_digits["clock_4"])
+		else:
+			_digits["clock"] = str(_digits["clock_1"]) + str(_digits["clock_2"]) + "." + str(_digits["clock_3"])
+
+		if(self.regionMeans.get("shot_clock_decimal", 255) > 100): # If >10s
+			_digits["shot_clock"] = str(_digits["shot_clock_1"]) + str(_digits["shot_clock_2"])
+		else:
+			_digits["shot_clock"] = str(_digits["shot_clock_1"]) + '.' + str(_digits["shot_clock_2"])
+		self.markStage("format")
+
+	def startStages(self):
+		"""Starts timing a frame when stageTimes is a dict. Stages: crop, colour, rotation,
+		erode, roi, autocrop, resize, match, format.
+		"""
+		if self.stageTimes is not None:
+			self.stageTimes.clear()
+			self._stageMark = time.perf_counter()
+
+	def markStage(self, stage):
+		"""Adds the time since the previous mark to stageTimes[stage], a no-op while stageTimes is None."""
+		if self.stageTimes is not None:
+			_now = time.perf_counter()
+			self.stageTimes[stage] = self.stageTimes.get(stage, 0.0) + _now - self._stageMark
+			self._stageMark = _now
+
+	def changeDetectionStats(self):
+		"""Returns how many region reads and result emissions change detection saved so far."""
+		hits = sum(self.fingerprintHits.values())
+		misses = sum(self.fingerprintMisses.values())
+		return {
+			"region_hits": hits,
+			"region_misses": misses,
+			"region_hit_ratio": float(hits) / (hits + misses) if hits + misses else 0.0,
+			"emitted": self.emittedResults,
+			"suppressed": self.suppressedResults,
+		}
+
+	def collectMetrics(self, metrics):
+		if self.grabber is not None:
+			metrics.set("scoreboard_frames_captured_total", self.grabber.framesCaptured)
+			metrics.set("scoreboard_frames_dropped_total", self.grabber.framesDropped)
+		metrics.set("scoreboard_frames_processed_total", self.framesProcessed)
+		for key, misses in self.recognitionMisses.items():
+			metrics.set("scoreboard_recognition_misses_total", misses, region=key)
+		for key, hits in self.fingerprintHits.items():
+			metrics.set("scoreboard_region_reads_total", hits, region=key, result="unchanged")
+			metrics.set("scoreboard_region_reads_total", self.fingerprintMisses[key], region=key, result="read")
+		metrics.set("scoreboard_results_total", self.emittedResults, result="emitted")
+		metrics.set("scoreboard_results_total", self.suppressedResults, result="unchanged")
+		scheduler = self.clockScheduler
+		if scheduler is not None:
+			metrics.set("scoreboard_scheduled_reads_total", scheduler.predictedReads, reason="rollover")
+			metrics.set("scoreboard_scheduled_reads_total", scheduler.verifyReads, reason="verify")
+			metrics.set("scoreboard_scheduled_reads_total", scheduler.skippedReads, reason="skipped")
+			metrics.set("scoreboard_clock_model_disagreements_total", scheduler.disagreements)
+		store = self.glyphStore
+		if store is not None:
+			metrics.set("scoreboard_unknown_glyphs", len(store.entries))
+			metrics.set("scoreboard_unknown_glyph_reads_total", store.reads)
+
+	def recordMetrics(self, frameSeconds):
+		"""Adds the stage times, processing time and capture-to-processing age of the last frame."""
+		for stage, seconds in self.stageTimes.items():
+			self.metrics.observe("scoreboard_stage_seconds", seconds, stage=stage)
+		self.metrics.observe("scoreboard_frame_seconds", frameSeconds)
+		self.metrics.observe("scoreboard_frame_age_seconds", self.frameAge)
+
+	def kill(self, timeout=5000):
+		"""Asks the loop to stop after the current frame and waits up to timeout ms until the camera
+		is released. Returns False when the thread is still running. Safe to call more than once,
+		and before the thread has started.
+		"""
 		self._isRunning = False
-		self.terminate()
+		if self.grabber is not None:
+			self.grabber.stop()
+		return self.wait(timeout)
+
+	def showPreview(self, img, img_processed, regions):
+		"""Shows the source, processed and debug windows and sends both frames to the Qt preview.
+		Called at most previewFPS times per second, and not at all while previewVisible is cleared.
+		"""
+		cv2.imshow("Source Video", img)
+
+		##### SHOW PROCESSED IMAGES #####
+		if self.debugRegion in self.regionCrops:
+			cv2.imshow("Test 1", cv2.resize(self.regionCrops[self.debugRegion], (50, 70), 1, 1, cv2.INTER_NEAREST))
+			cv2.imshow("Test 2", cv2.resize(self.regionGlyphs[self.debugRegion], (50, 70), 1, 1, cv2.INTER_NEAREST))
+
+		##### SHOW PRELIMINARY PROCESSED IMAGE WITH BOUNDING BOXES, X, Y #####
+		img_disp = cv2.cvtColor(img_processed, cv2.COLOR_GRAY2BGR)
+
+		cv2.putText(img_disp, str(self.mouse_coordinates[0]) + ", " + str(self.mouse_coordinates[1]), (5, 15), cv2.FONT_ITALIC, 0.4, (0,0,0))
+		cv2.putText(img_disp, "Unchanged: %d%%" % (100 * self.changeDetectionStats()["region_hit_ratio"]), (5, 30), cv2.FONT_ITALIC, 0.4, (0,0,0))
+
+		boxes = regions.clipped(*img_processed.shape[:2])[0]
+		for key, kind, (tl_X, tl_Y, br_X, br_Y), slices in boxes:
+			cv2.rectangle(img_disp, (tl_X, tl_Y), (br_X, br_Y), (0,0,255), 1)
+
+		cv2.imshow("Bounding Boxes", img_disp)
+
+		##### SEND SMALL RGB FRAMES TO DISPLAY IN PYSIDE WINDOW #####
+		_processed = self.previewFrame(img_processed)
+		_scale = float(_processed.shape[1]) / img_processed.shape[1]
+		for key, kind, (tl_X, tl_Y, br_X, br_Y), slices in boxes: # Drawn after scaling so the 1 px boxes stay visible
+			cv2.rectangle(_processed, (int(tl_X * _scale), int(tl_Y * _scale)), (int(br_X * _scale), int(br_Y * _scale)), (255,0,0), 1)
+		self.previewFrames.emit([self.previewFrame(img), _processed])
+
+	def setPreviewFPS(self, previewFPS):
+		"""Sets the preview updates per second from a settings field, the default 5 when it is empty or not a number."""
+		try:
+			self.previewFPS = float(previewFPS)
+		except (TypeError, ValueError):
+			self.previewFPS = 5.0
+
+	def previewFrame(self, img):
+		"""Returns a BGR or grayscale frame scaled down to previewWidth, in RGB order for a QImage."""
+		height = max(1, img.shape[0] * self.previewWidth // img.shape[1])
+		img = cv2.resize(img, (self.previewWidth, height), interpolation=cv2.INTER_LINEAR)
+		return cv2.cvtColor(img, cv2.COLOR_GRAY2RGB if img.ndim == 2 else cv2.COLOR_BGR2RGB)
+
+	def openCapture(self):
+		"""Opens the webcam at videoCaptureIndex, or a video file when it is not a number."""
+		source = str(self.videoCaptureIndex).strip()
+		if source.isdigit():
+			cam = cv2.VideoCapture(int(source))   # 0 -> index of camera
+		else:
+			cam = cv2.VideoCapture(os.path.join(_applicationPath, source))	# video file, e.g. test_images/test_video.mp4
+
+		print("Webcam native resolution: ", cam.get(cv2.CAP_PROP_FRAME_WIDTH), cam.get(cv2.CAP_PROP_FRAME_HEIGHT))
+		cam.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
+		cam.set(cv2.CAP_PROP_FRAME_HEIGHT, 540)
+		cam.set(cv2.CAP_PROP_BUFFERSIZE, 1) # Keep the driver queue short, FrameGrabber drops stale frames itself
+		return cam
 
 	def run(self):
 		try:
-			#self.cam = VideoCapture(int(self.videoCaptureIndex))   # 0 -> index of camera
-
-			self.cam.set(cv2.CAP_PROP_POS_FRAMES, 100)					# run from frame 100
-			self.cam = cv2.VideoCapture('test_images/test_video.mp4')	# start video
-
-			print("Webcam native resolution: ", self.cam.get(cv2.CAP_PROP_FRAME_WIDTH), self.cam.get(cv2.CAP_PROP_FRAME_HEIGHT))
-			self.cam.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
-			self.cam.set(cv2.CAP_PROP_FRAME_HEIGHT, 540)
-
-			cv2.namedWindow("Source Video", cv2.WINDOW_AUTOSIZE)
-			cv2.namedWindow("Bounding Boxes", cv2.WINDOW_AUTOSIZE)
-			cv2.namedWindow("Test 1", cv2.WINDOW_AUTOSIZE)
-			cv2.namedWindow("Test 2", cv2.WINDOW_AUTOSIZE)
-
-			cv2.moveWindow("Source Video", 0, 10)
-			cv2.moveWindow("Bounding Boxes", 500, 0)
-			cv2.moveWindow("Test 1", 600, 0)
-			cv2.moveWindow("Test 2", 660, 0)
-
-			cv2.setMouseCallback("Bounding Boxes", self.mouse_hover_coordinates)
-
-			self._isRunning = True
+			self.cam = self.openCapture()
+			_interval = 0
+			if not str(self.videoCaptureIndex).strip().isdigit(): # Play files back in real time
+				_fps = self.cam.get(cv2.CAP_PROP_FPS)
+				_interval = 1.0 / _fps if _fps > 0 else 0.04
+			self.recognizer.prepare() # Helper processes start while the first frame is read
+			self.grabber = FrameGrabber(self.cam, interval=_interval)
+			self.grabber.start()
+
+			if self.metrics is not None:
+				self.stageTimes = {}
+				self.metrics.describe("scoreboard_frames_captured_total", "counter", "Frames read from the camera")
+				self.metrics.describe("scoreboard_frames_dropped_total", "counter", "Frames replaced by a newer one before processing")
+				self.metrics.describe("scoreboard_frames_processed_total", "counter", "Frames run through the OCR pipeline")
+				self.metrics.describe("scoreboard_recognition_misses_total", "counter", "Digit reads too far from every reference")
+				self.metrics.describe("scoreboard_region_reads_total", "counter", "Regions read again or skipped as unchanged")
+				self.metrics.describe("scoreboard_results_total", "counter", "Frames whose clocks were emitted or matched the last emission")
+				self.metrics.describe("scoreboard_scheduled_reads_total", "counter", "Higher-order digit reads by the clock model, and digits skipped")
+				self.metrics.describe("scoreboard_clock_model_disagreements_total", "counter", "Verification reads that found an unexpected digit")
+				self.metrics.describe("scoreboard_unknown_glyphs", "gauge", "Distinct captured glyphs without an exact reference")
+				self.metrics.describe("scoreboard_unknown_glyph_reads_total", "counter", "Digit reads without an exact reference")
+				self.metrics.describe("scoreboard_stage_seconds", "histogram", "Time per pipeline stage")
+				self.metrics.describe("scoreboard_frame_seconds", "histogram", "Processing time per frame")
+				self.metrics.describe("scoreboard_frame_age_seconds", "histogram", "Time from capture to processing")
+				self.metrics.addCollector(self.collectMetrics)
+
+			if self.preview:
+				cv2.namedWindow("Source Video", cv2.WINDOW_AUTOSIZE)
+				cv2.namedWindow("Bounding Boxes", cv2.WINDOW_AUTOSIZE)
+				cv2.namedWindow("Test 1", cv2.WINDOW_AUTOSIZE)
+				cv2.namedWindow("Test 2", cv2.WINDOW_AUTOSIZE)
+
+				cv2.moveWindow("Source Video", 0, 10)
+				cv2.moveWindow("Bounding Boxes", 500, 0)
+				cv2.moveWindow("Test 1", 600, 0)
+				cv2.moveWindow("Test 2", 660, 0)
+
+				cv2.setMouseCallback("Bounding Boxes", self.mouse_hover_coordinates)
+				self._previewWindows = True
 
 			while self._isRunning:
-				if self.cam is None or not self.cam.isOpened():
-					break
-
-				success, img = self.cam.read()
-
-				if success:
-					cv2.imshow("Source Video", img)
-
-					##### CROP IMAGE ######
-					img_cropped = cv2.copyMakeBorder(img, 0, 0, 0, 0, cv2.BORDER_REPLICATE)
-					if(self.cropLeft >= 0):
-						img_cropped = img_cropped[0:img_cropped.shape[0], self.cropLeft:img_cropped.shape[1]]
-					elif(self.cropLeft < 0):
-						img_cropped = cv2.copyMakeBorder(img_cropped,0,0,abs(self.cropLeft),0,cv2.BORDER_CONSTANT, value=[255,255,255])
-					if(self.cropTop >= 0):
-						img_cropped = img_cropped[self.cropTop:img_cropped.shape[0], 0:img_cropped.shape[1]]
-					elif(self.cropTop < 0):
-						img_cropped = cv2.copyMakeBorder(img_cropped,abs(self.cropTop),0,0,0,cv2.BORDER_CONSTANT, value=[255,255,255])
-
-					#img = shiftImage(img, int(self.cropLeft), int(self.cropTop))
-
-					##### OPENCV PROCESSING TEST ######
-					img_HSV = cv2.cvtColor(img_cropped, cv2.COLOR_BGR2HSV)
-
-					rows,cols,_ = img_HSV.shape
-					M = cv2.getRotationMatrix2D((cols/2,rows/2), self.rotation, 1)
-					img_HSV = cv2.warpAffine(img_HSV, M, (cols,rows))
-
-					threshA = cv2.inRange(img_HSV, (20, 40, 40), (40, 255, 255))
-					threshB = cv2.inRange(img_HSV, (170, 60, 60), (180, 255, 255))
-					threshC = cv2.inRange(img_HSV, (0, 60, 60), (10, 255, 255))
-					th3 = threshA + threshB + threshC
-					ret3, th3 = cv2.threshold(th3, 127, 255, cv2.THRESH_BINARY_INV)
-					img_processed = cv2.erode(th3, numpy.ones((2,2),numpy.uint8), iterations = self.erosion)
-
-					##### CROP IMAGES TO BOUNDING BOX, INVERT, RUN CROPPING ALGORITHM #####
-					clock_1 = img_processed[int('0' + self.coords["clock_1"][2]):int('0' + self.coords["clock_1"][4]), int('0' + self.coords["clock_1"][1]):int('0' + self.coords["clock_1"][3])]
-					clock_2 = img_processed[int('0' + self.coords["clock_2"][2]):int('0' + self.coords["clock_2"][4]), int('0' + self.coords["clock_2"][1]):int('0' + self.coords["clock_2"][3])]
-					clock_3 = img_processed[int('0' + self.coords["clock_3"][2]):int('0' + self.coords["clock_3"][4]), int('0' + self.coords["clock_3"][1]):int('0' + self.coords["clock_3"][3])]
-					clock_4 = img_processed[int('0' + self.coords["clock_4"][2]):int('0' + self.coords["clock_4"][4]), int('0' + self.coords["clock_4"][1]):int('0' + self.coords["clock_4"][3])]
-					shot_clock_1 = img_processed[int('0' + self.coords["shot_clock_1"][2]):int('0' + self.coords["shot_clock_1"][4]), int('0' + self.coords["shot_clock_1"][1]):int('0' + self.coords["shot_clock_1"][3])]
-					shot_clock_2 = img_processed[int('0' + self.coords["shot_clock_2"][2]):int('0' + self.coords["shot_clock_2"][4]), int('0' + self.coords["shot_clock_2"][1]):int('0' + self.coords["shot_clock_2"][3])]
-
-					clock_1_cropped = autocrop(cv2.threshold(clock_1, 127, 255, cv2.THRESH_BINARY_INV)[1], 10)
-					clock_2_cropped = autocrop(cv2.threshold(clock_2, 127, 255, cv2.THRESH_BINARY_INV)[1], 10)
-					clock_3_cropped = autocrop(cv2.threshold(clock_3, 127, 255, cv2.THRESH_BINARY_INV)[1], 10)
-					clock_4_cropped = autocrop(cv2.threshold(clock_4, 127, 255, cv2.THRESH_BINARY_INV)[1], 10)
-					shot_clock_1_cropped = autocrop(cv2.threshold(shot_clock_1, 127, 255, cv2.THRESH_BINARY_INV)[1], 10)
-					shot_clock_2_cropped = autocrop(cv2.threshold(shot_clock_2, 127, 255, cv2.THRESH_BINARY_INV)[1], 10)
-					
-					##### RESIZE WITH NEAREST NEIGHBOR, then INVERT #####
-					ret, clock_1_resized = cv2.threshold(cv2.resize(clock_1_cropped, (5, 7), 1, 1, cv2.INTER_NEAREST), 127, 255, cv2.THRESH_BINARY_INV)
-					ret, clock_2_resized = cv2.threshold(cv2.resize(clock_2_cropped, (5, 7), 1, 1, cv2.INTER_NEAREST), 127, 255, cv2.THRESH_BINARY_INV)
-					ret, clock_3_resized = cv2.threshold(cv2.resize(clock_3_cropped, (5, 7), 1, 1, cv2.INTER_NEAREST), 127, 255, cv2.THRESH_BINARY_INV)
-					ret, clock_4_resized = cv2.threshold(cv2.resize(clock_4_cropped, (5, 7), 1, 1, cv2.INTER_NEAREST), 127, 255, cv2.THRESH_BINARY_INV)
-					ret, shot_clock_1_resized = cv2.threshold(cv2.resize(shot_clock_1_cropped, (5, 7), 1, 1, cv2.INTER_NEAREST), 127, 255, cv2.THRESH_BINARY_INV)
-					ret, shot_clock_2_resized = cv2.threshold(cv2.resize(shot_clock_2_cropped, (5, 7), 1, 1, cv2.INTER_NEAREST), 127, 255, cv2.THRESH_BINARY_INV)
-
-
-					##### SHOW PROCESSED IMAGES #####
-					cv2.imshow("Test 1", cv2.resize(clock_3_cropped, (50, 70), 1, 1, cv2.INTER_NEAREST))
-					cv2.imshow("Test 2", cv2.resize(clock_3_resized, (50, 70), 1, 1, cv2.INTER_NEAREST))
-
-					#cv2.imwrite('digits/'+str(int(round(time.time() * 1000)))+'.png', clock_2_resized)
-
-					##### COMPARE MATRICES TO REFERENCE DIGITS #####
-					for index, ref_digits in enumerate(self.referenceDigits):
-						for digit in ref_digits:
-							if(index == 10): _index = ""
-							else: _index = index
-							if((clock_1_resized == digit).all()): 
-								self.retOCRDigits["clock_1"] = _index
-							if((clock_2_resized == digit).all()): 
-								self.retOCRDigits["clock_2"] = _index
-							if((clock_3_resized == digit).all()): 
-								self.retOCRDigits["clock_3"] = _index
-							if((clock_4_resized == digit).all()): 
-								self.retOCRDigits["clock_4"] = _index
-							if((shot_clock_1_resized == digit).all()): 
-								self.retOCRDigits["shot_clock_1"] = _index
-							if((shot_clock_2_resized == digit).all()): 
-								self.retOCRDigits["shot_clock_2"] = _index
-
-					shot_clock_decimal = img_processed[int('0' + self.coords["shot_clock_decimal"][2]):int('0' + self.coords["shot_clock_decimal"][4]), int('0' + self.coords["shot_clock_decimal"][1]):int('0' + self.coords["shot_clock_decimal"][3])]
-					clock_colon = img_processed[int('0' + self.coords["clock_colon"][2]):int('0' + self.coords["clock_colon"][4]), int('0' + self.coords["clock_colon"][1]):int('0' + self.coords["clock_colon"][3])]
-					self.retOCRDigits["clock_colon"] = str(clock_colon.mean())[:3]
-					self.retOCRDigits["shot_clock_decimal"] = str(shot_clock_decimal.mean())[:3]
-
-					##### CLOCKS FORMATTING ######
-					if(clock_colon.mean() < 100): # If has colon
-						self.retOCRDigits["clock"] = str(self.retOCRDigits["clock_1"]) + str(self.retOCRDigits["clock_2"]) + ":" + str(self.retOCRDigits["clock_3"]) + str(self.retOCRDigits["clock_4"]) 
-					else:
-						self.retOCRDigits["clock"] = str(self.retOCRDigits["clock_1"]) + str(self.retOCRDigits["clock_2"]) + "." + str(self.retOCRDigits["clock_3"])
-					
-					if(shot_clock_decimal.mean() > 100): # If >10s
-						self.retOCRDigits["shot_clock"] = str(self.retOCRDigits["shot_clock_1"]) + str(self.retOCRDigits["shot_clock_2"])
-					else:
-						self.retOCRDigits["shot_clock"] = str(self.retOCRDigits["shot_clock_1"]) + '.' + str(self.retOCRDigits["shot_clock_2"])
-
-					##### SHOW PRELIMINARY PROCESSED IMAGE WITH BOUNDING BOXES, X, Y #####
-					img_disp = cv2.copyMakeBorder(img_processed, 0, 0, 0, 0, cv2.BORDER_REPLICATE)
-					img_disp = cv2.cvtColor(img_disp, cv2.COLOR_GRAY2RGB)
-
-					cv2.putText(img_disp, str(self.mouse_coordinates[0]) + ", " + str(self.mouse_coordinates[1]), (5, 15), cv2.FONT_ITALIC, 0.4, (0,0,0))
-
-					cv2.rectangle(img_disp, (int('0' + self.coords["clock_1"][1]), int('0' + self.coords["clock_1"][2])), (int('0' + self.coords["clock_1"][3]), int('0' + self.coords["clock_1"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["clock_2"][1]), int('0' + self.coords["clock_2"][2])), (int('0' + self.coords["clock_2"][3]), int('0' + self.coords["clock_2"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["clock_3"][1]), int('0' + self.coords["clock_3"][2])), (int('0' + self.coords["clock_3"][3]), int('0' + self.coords["clock_3"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["clock_4"][1]), int('0' + self.coords["clock_4"][2])), (int('0' + self.coords["clock_4"][3]), int('0' + self.coords["clock_4"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["clock_colon"][1]), int('0' + self.coords["clock_colon"][2])), (int('0' + self.coords["clock_colon"][3]), int('0' + self.coords["clock_colon"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["shot_clock_1"][1]), int('0' + self.coords["shot_clock_1"][2])), (int('0' + self.coords["shot_clock_1"][3]), int('0' + self.coords["shot_clock_1"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["shot_clock_2"][1]), int('0' + self.coords["shot_clock_2"][2])), (int('0' + self.coords["shot_clock_2"][3]), int('0' + self.coords["shot_clock_2"][4])), (0,0,255), 1)
-					cv2.rectangle(img_disp, (int('0' + self.coords["shot_clock_decimal"][1]), int('0' + self.coords["shot_clock_decimal"][2])), (int('0' + self.coords["shot_clock_decimal"][3]), int('0' + self.coords["shot_clock_decimal"][4])), (0,0,255), 1)
-
-					cv2.imshow("Bounding Boxes", img_disp)
-
-					##### SEND QIMAGE TO DISPLAY IN PYSIDE WINDOW #####
-					height, width, bPC = img.shape
-					_ret_QImageRaw = QImage(img.data, width, height, bPC * width, QImage.Format_RGB888).rgbSwapped()
-					height, width, bPC = img_disp.shape
-					_ret_QImageProcessed = QImage(img_disp.data, width, height, bPC * width, QImage.Format_RGB888).rgbSwapped()
-					self.QImageFrame.emit([_ret_QImageRaw, _ret_QImageProcessed])
-
-
-					cv2.waitKey(int(self.waitKey))
-					self.processedFrameFlag.emit(1)
-					self.recognizedDigits.emit(self.retOCRDigits)
-
-
+				frame = self.grabber.latest(0.25) # Newest frame only, older ones are dropped
+				if frame is None:
+					if self.grabber.exhausted: # Camera unplugged or end of file
+						break
+					continue
+
+				img, capturedAt = frame
+				loopStart = time.time()
+				self.frameAge = loopStart - capturedAt
+				self.startStages()
+				self.swapRecognizer()
+				regions = self.regionConfig # One configuration for the whole frame, the GUI may swap in the next
+
+				img_processed = self.preprocessFrame(img, regions)
+
+				##### READ ALL REGIONS, FORMAT CLOCKS #####
+				self.recognizeScheduled(img_processed, regions)
+				self.formatClocks()
+
+				if self.preview and self.previewVisible and self.previewFPS > 0 and loopStart - self._lastPreview >= 1.0 / self.previewFPS:
+					self._lastPreview = loopStart
+					self.showPreview(img, img_processed, regions)
+
+				self.processedFrameFlag.emit(1)
+				##### EMIT ONLY WHEN THE DECODED CLOCKS CHANGED #####
+				_published = (self.retOCRDigits["clock"], self.retOCRDigits["shot_clock"])
+				if _published != self.lastPublished:
+					self.lastPublished = _published
+					self.emittedResults += 1
+					_digits = dict(self.retOCRDigits) # Copy, the GUI thread reads it later
+					_digits["captured_at"] = capturedAt
+					self.recognizedDigits.emit(_digits)
+				else:
+					self.suppressedResults += 1
+
+				self.framesProcessed += 1
+				if self.metrics is not None:
+					self.recordMetrics(time.time() - loopStart)
+
+				##### WAIT UNTIL waitKey MS AFTER THIS PASS STARTED, KEEP WINDOWS RESPONSIVE #####
+				_wait = max(int(self.waitKey) - int((time.time() - loopStart) * 1000), 1)
+				if self._previewWindows:
+					cv2.waitKey(_wait)
+				else:
+					time.sleep(_wait / 1000.0)
 
 		except Exception as e:
 			print(e)
 			# self.error.emit(1)
 
+		finally:
+			if self.metrics is not None:
+				self.metrics.removeCollector(self.collectMetrics)
+			if self.grabber is not None:
+				self.grabber.stop()
+				if not self.grabber.wait(2000) and self.grabber.releaseOnExit(): # cam.read() blocks on a stalled camera
+					print("Camera read did not return, releasing the camera when it does")
+					self.cam = None
+			if self.cam is not None:
+				self.cam.release()
+			self.setCaptureUnknown(False) # Last flush of the captured glyphs
+			self.recognizer.close()
+			if self._previewWindows:
+				cv2.destroyAllWindows()
+				cv2.waitKey(1)
+
+def runCameraProcess(settingsFilePath, results, stopEvent):
+	"""Child process of CameraSupervisor: runs one camera's OCR loop on this process's main thread
+	and puts the game fields it reads (see cameraFields) and their capture time on results
+	whenever they change. Frames never leave the process.
+	"""
+	signal.signal(signal.SIGINT, signal.SIG_IGN) # Ctrl+C reaches the supervisor, which sets stopEvent
+	settings = loadWorkerSettings(settingsFilePath)
+	fields = cameraFields(settings["OCRCoordinatesList"])
+	worker = SCOCRWorker(preview=False, **settings)
+	worker.recognizedDigits.connect(lambda digitDict: results.put(({"game": dict((field, digitDict[field]) for field in fields)}, digitDict.get("captured_at"))), QtCore.Qt.DirectConnection)
+	threading.Thread(target=lambda: stopEvent.wait() and worker.kill(0), daemon=True).start()
+	worker.run()
+
+
+class CameraSupervisor(object):
+	"""Runs one runCameraProcess per settings file, so every camera gets its own core, and
+	publishes their results through one WebSocketsWorker, which merges them into one game message.
+	Webcam processes that exit on their own are restarted after restartDelay seconds.
+	Processes are spawned, not forked: the reactor, the server sockets and the worker threads
+	are already running here, and a forked child would inherit them and their locks.
+	"""
+	restartDelay = 2.0
+
+	def __init__(self, settingsFilePaths, webSocketsWorker):
+		self.settingsFilePaths = list(settingsFilePaths)
+		self.webSocketsWorker = webSocketsWorker
+		self.webcams = set(path for path in self.settingsFilePaths if str(loadWorkerSettings(path)["videoCaptureIndex"]).strip().isdigit())
+		self.context = multiprocessing.get_context("spawn")
+		self.results = self.context.Queue()
+		self.stopEvent = self.context.Event()
+		self.processes = {} # Settings file -> running multiprocessing.Process
+		self.restartAt = {} # Settings file -> time.time() to start it again
+		self.reader = threading.Thread(target=self.readResults, daemon=True)
+
+	def start(self):
+		for path in self.settingsFilePaths:
+			self.startProcess(path)
+		self.reader.start()
+
+	def startProcess(self, path):
+		process = self.context.Process(target=runCameraProcess, args=(path, self.results, self.stopEvent), name="OCR " + os.path.basename(path))
+		process.daemon = True
+		process.start()
+		self.processes[path] = process
+
+	def readResults(self):
+		while True:
+			result = self.results.get()
+			if result is None:
+				return
+			packet, capturedAt = result
+			self.webSocketsWorker.publish(packet, capturedAt)
+
+	def poll(self):
+		"""Restarts webcams that stopped, returns False once every camera has ended."""
+		for path, process in list(self.processes.items()):
+			if process.is_alive():
+				continue
+			del self.processes[path]
+			print("camera process for {} exited with {}".format(path, process.exitcode))
+			if path in self.webcams and not self.stopEvent.is_set():
+				self.restartAt[path] = time.time() + self.restartDelay
+		for path, restartAt in list(self.restartAt.items()):
+			if time.time() >= restartAt:
+				del self.restartAt[path]
+				self.startProcess(path)
+		return bool(self.processes or self.restartAt)
+
+	def stop(self, timeout=5.0):
+		self.stopEvent.set()
+		self.restartAt = {}
+		for process in self.processes.values():
+			process.join(timeout)
+			if process.is_alive():
+				process.terminate()
+		self.results.put(None)
+		self.reader.join(1.0)
+
+
+def runHeadless(settingsFilePaths=(_settingsFilePath,), preview=False, server="twisted"):
+	"""Runs the OCR loop with the settings saved by the GUI and publishes through the
+	WebSocket/HTTP server, without any widgets. With several settings files every camera runs
+	in its own process under a CameraSupervisor. Returns when the cameras or videos end,
+	or on Ctrl+C / SIGTERM. server "asyncio" serves with AsyncioWebSocketsServer instead of
+	the Twisted WebSocketsWorker.
+	"""
+	app = QtCore.QCoreApplication(sys.argv)
+	if server == "asyncio":
+		from asyncio_server import AsyncioWebSocketsServer # Needs the websockets package, only in this mode
+		webSocketsWorker = AsyncioWebSocketsServer()
+		try:
+			webSocketsWorker.start()
+		except OSError as e:
+			print("Could not start the server: {}".format(e))
+			return 1
+	else:
+		webSocketsWorker = WebSocketsWorker()
+		webSocketsWorker.error.connect(lambda error: app.exit(1))
+		webSocketsWorker.start()
+
+	worker = None
+	supervisor = None
+	if len(settingsFilePaths) > 1:
+		supervisor = CameraSupervisor(settingsFilePaths, webSocketsWorker)
+		supervisor.start()
+		_supervisorTimer = QtCore.QTimer()
+		_supervisorTimer.timeout.connect(lambda: supervisor.poll() or app.quit())
+		_supervisorTimer.start(500)
+	else:
+		worker = SCOCRWorker(preview=preview, **loadWorkerSettings(settingsFilePaths[0]))
+		worker.metrics = webSocketsWorker.metrics
+		worker.recognizedDigits.connect(lambda digitDict: webSocketsWorker.publish(gamePacket(digitDict), digitDict.get("captured_at")), QtCore.Qt.DirectConnection) # publish() is thread safe
+		worker.finished.connect(app.quit)
+		worker.start()
+
+	for _signal in (signal.SIGINT, signal.SIGTERM):
+		signal.signal(_signal, lambda *args: app.quit())
+	_signalTimer = QtCore.QTimer() # Lets the Python signal handlers run while Qt waits
+	_signalTimer.timeout.connect(lambda: None)
+	_signalTimer.start(250)
+
+	try:
+		return app.exec_()
+	finally:
+		if worker is not None and not worker.kill():
+			worker.wait()
+		if supervisor is not None:
+			supervisor.stop()
+		webSocketsWorker.stop()
+		webSocketsWorker.wait(2000)
+
 if __name__ == '__main__':
-	app = QtWidgets.QApplication(sys.argv)
+	multiprocessing.freeze_support() # Camera processes of the frozen executable
+	if sys.argv[1:2] == ["--ocr-helper"]: # Recognizer helper of the frozen executable, see ExternalRecognizer.helperArguments
+		import ocr_helper
+		sys.exit(ocr_helper.main(sys.argv[2:]))
+	parser = argparse.ArgumentParser(description="Scoreboard webcam OCR")
+	parser.add_argument("--headless", action="store_true", help="run without GUI, using the settings saved by it")
+	parser.add_argument("--settings", action="append", help="settings.ini to read in headless mode, once per camera")
+	parser.add_argument("--preview", action="store_true", help="show the OpenCV debug windows in headless mode, single camera only")
+	parser.add_argument("--server", choices=["twisted", "asyncio"], default="twisted", help="WebSocket/HTTP server core in headless mode")
+	parser.add_argument("--promote", action="append", metavar="CODE=DIGIT", help="copy a glyph from unknown_digits/index.json into ref_digits/ and exit, DIGIT empty for blank")
+	args, qtArgs = parser.parse_known_args()
+
+	if args.promote:
+		for promotion in args.promote:
+			code, label = promotion.split("=", 1)
+			print(promoteGlyph(code, label))
+		sys.exit(0)
+
+	if args.headless:
+		sys.exit(runHeadless(args.settings or [_settingsFilePath], args.preview, args.server))
+
+	app = QtWidgets.QApplication(sys.argv[:1] + qtArgs)
 	ex = MainWindow()
 	sys.exit(app.exec_())
@@ -2,7 +2,7 @@
 a = Analysis(['application.py'],
              pathex=['C:\Users\XYK\Desktop\Dropbox\Choxue-scoreboard-OCR'],
             # pathex=['/Users/XYK/Desktop/Dropbox/Choxue-scoreboard-OCR'],
-             hiddenimports=[],
+             hiddenimports=['ocr_helper'], # Run by the external recognizer as application --ocr-helper
              hookspath=None,
              runtime_hooks=None)
 
@@ -0,0 +1,183 @@
+# coding: utf8
+# Headless server core on one asyncio event loop instead of the Twisted reactor thread, on the
+# websockets package: the ws://:9000 broadcast protocol of WebSocketsWorker in application.py
+# (JSON deltas, scoreboard.bin clock frames, permessage-deflate) and its :8080 site and /metrics.
+# Imports neither Twisted nor Qt, so it runs next to either.
+
+import asyncio
+import http
+import json
+import threading
+import urllib.parse
+
+import websockets.asyncio.server
+from websockets.datastructures import Headers
+from websockets.exceptions import ConnectionClosed
+from websockets.http11 import Response
+
+from scoreboard_server import _applicationPath, _gameFrameProtocol, _scoreboardFeedURL, MetricsPage, OverlayAssets, ScoreboardBroadcast, ScoreboardFeedPoller, serverMetrics
+
+
+class AsyncioWebSocketsServer(object):
+	"""Serves the overlay without Qt or Twisted. publish() only puts on the ScoreboardBroadcast
+	queue, drained in one batch every publishInterval, so publishing threads never wake the loop.
+	run() serves on the calling thread, start() on a new one. The :8080 site answers GET and HEAD
+	requests from the websockets handshake hook, one request per connection.
+	"""
+	maxMessageSize = 64 * 1024 # Bytes of a message from a client, larger ones close with 1009
+	closeTimeout = 1.0 # Seconds a connection gets to close before stop() drops it
+
+	class Request(object):
+		"""The parts of a twisted.web request that OverlayAssets and MetricsPage use."""
+		def __init__(self, request):
+			path, _, query = request.path.partition("?")
+			self.path = path.encode('utf8')
+			self.args = urllib.parse.parse_qs(query.encode('latin-1'))
+			self.requestHeaders = request.headers
+			self.responseHeaders = {}
+			self.code = 200
+
+		def getHeader(self, name):
+			value = self.requestHeaders.get(name.decode('latin-1'))
+			return None if value is None else value.encode('latin-1')
+
+		def setHeader(self, name, value):
+			self.responseHeaders[name.decode('latin-1')] = value.decode('latin-1')
+
+		def setResponseCode(self, code):
+			self.code = code
+
+	class Client(object):
+		"""One WebSocket connection, as ScoreboardBroadcast sees it."""
+		def __init__(self, server, connection):
+			self.server = server
+			self.connection = connection
+			host, port = connection.remote_address[:2]
+			self.peer = "tcp%d:%s:%d" % (6 if ":" in host else 4, host, port)
+			self.binary = connection.subprotocol == _gameFrameProtocol
+			self.stale = False # Missed updates while paused, gets the whole state once drained
+
+		@property
+		def paused(self):
+			transport = self.connection.transport
+			return transport.is_closing() or transport.get_write_buffer_size() > self.server.broadcast.clientBufferLimit
+
+		def sendMessage(self, payload, isBinary=False, doNotCompress=False):
+			"""Writes without waiting, ScoreboardBroadcast checks paused first. Deflate is negotiated
+			for the whole connection, so doNotCompress cannot be honoured."""
+			websockets.asyncio.server.broadcast([self.connection], payload, text=not isBinary)
+
+	def __init__(self, host="", webSocketPort=9000, httpPort=8080, feedURL=_scoreboardFeedURL, deflate=True, root=_applicationPath):
+		self.host = host
+		self.webSocketPort = webSocketPort
+		self.httpPort = httpPort
+		self.deflate = deflate
+		self.broadcast = ScoreboardBroadcast()
+		self.feed = ScoreboardFeedPoller(self.broadcast.queue, feedURL) # Follows the published gameID
+		self.assets = OverlayAssets(root)
+		self.metrics = serverMetrics(self.broadcast, self.feed, self.assets) # Served as /metrics, shared with SCOCRWorker
+		self.metricsPage = MetricsPage(self.metrics)
+		self.error = None # Exception that stopped the server, like a port in use
+		self.loop = None
+		self._stopping = False
+		self._ready = threading.Event()
+		self._thread = None
+
+	def publish(self, update, capturedAt=None):
+		"""Queues a nested dict update. The loop sends only the changed fields, once per publishInterval."""
+		if "gameID" in update:
+			self.feed.setGameID(update["gameID"])
+		self.broadcast.queue(update, capturedAt)
+
+	def send(self, data):
+		self.publish(json.loads(data))
+
+	def start(self, timeout=5.0):
+		"""Serves on a new thread. Raises the error if the ports cannot be opened."""
+		self._thread = threading.Thread(target=self.runThread, name="AsyncioWebSocketsServer", daemon=True)
+		self._thread.start()
+		self._ready.wait(timeout)
+		if self.error is not None:
+			raise self.error
+
+	def runThread(self):
+		try:
+			self.run()
+		except Exception as e:
+			self.error = e
+			self._ready.set()
+
+	def run(self):
+		"""Serves on the calling thread until stop()."""
+		asyncio.run(self.serve())
+
+	def stop(self):
+		"""Stops serving, from any thread."""
+		self._stopping = True # Seen by the publish loop within publishInterval
+		self.feed.close()
+
+	def wait(self, msecs=None):
+		"""Waits for the server thread like QThread.wait, returns True once it ended."""
+		if self._thread is not None:
+			self._thread.join(None if msecs is None else msecs / 1000.0)
+			return not self._thread.is_alive()
+		return True
+
+	async def serve(self):
+		self.loop = asyncio.get_running_loop()
+		self._stopping = False
+		webSocketServer = await websockets.asyncio.server.serve(self.serveWebSocket, self.host or None, self.webSocketPort,
+			subprotocols=[_gameFrameProtocol], select_subprotocol=self.selectSubprotocol,
+			compression="deflate" if self.deflate else None, max_size=self.maxMessageSize, close_timeout=self.closeTimeout)
+		try:
+			httpServer = await websockets.asyncio.server.serve(self.serveWebSocket, self.host or None, self.httpPort,
+				process_request=self.serveHTTP, compression=None, close_timeout=self.closeTimeout)
+		except OSError:
+			webSocketServer.close()
+			raise
+		self.assets.refresh() # Build before the first request
+		self.feed.start()
+		self._ready.set()
+		try:
+			while not self._stopping:
+				await asyncio.sleep(self.broadcast.publishInterval)
+				self.broadcast.publish()
+				for c in list(self.broadcast.clients):
+					if c.stale and not c.paused: # Transport drained
+						self.broadcast.sendState(c)
+		finally:
+			for _server in (webSocketServer, httpServer):
+				_server.close() # Closes the open connections with 1001
+			for _server in (webSocketServer, httpServer):
+				await _server.wait_closed()
+
+	def selectSubprotocol(self, connection, subprotocols):
+		"""scoreboard.bin when offered, otherwise JSON text like WebSocketsWorker, whatever else the client offers."""
+		return _gameFrameProtocol if _gameFrameProtocol in subprotocols else None
+
+	async def serveWebSocket(self, connection):
+		client = self.Client(self, connection)
+		self.broadcast.register(client)
+		try:
+			async for message in connection:
+				if isinstance(message, str): # Text is echoed to everyone like WebSocketsWorker, binary is ignored
+					self.broadcast.broadcast("{} from {}".format(message, client.peer))
+		except ConnectionClosed:
+			pass
+		finally:
+			self.broadcast.unregister(client)
+
+	def serveHTTP(self, connection, request):
+		"""Answers every request of the :8080 server, so none becomes a WebSocket."""
+		adapter = self.Request(request)
+		if request.method in ("GET", "HEAD"):
+			resource = self.metricsPage if adapter.path.rstrip(b"/") == b"/metrics" else self.assets
+			body = resource.render_GET(adapter)
+		else:
+			adapter.setResponseCode(405)
+			adapter.setHeader(b"Allow", b"GET, HEAD")
+			body = b""
+		if "Content-Length" not in adapter.responseHeaders and adapter.code != 304:
+			adapter.setHeader(b"Content-Length", str(len(body)).encode('ascii'))
+		adapter.setHeader(b"Connection", b"close")
+		return Response(adapter.code, http.HTTPStatus(adapter.code).phrase, Headers(adapter.responseHeaders), body if request.method != "HEAD" else b"")
@@ -0,0 +1,220 @@
+# coding: utf8
+# Runs test_images/ (and any video file) through the SCOCRWorker pipeline without a display or camera
+# and reports per-stage latency percentiles, frames per second and allocations.
+# --compare reads the same frames with a second recognizer backend and reports how often they agree.
+# Usage: python benchmark.py [paths ...] [--settings settings.ini] [--repeat 20] [--compare segments] [--json results.json]
+
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy
+import cv2
+
+from application import _applicationPath, _settingsFilePath, SCOCRWorker, createRecognizer, loadWorkerSettings, recognizerBackends
+
+Stages = ["crop", "colour", "rotation", "erode", "roi", "invert", "autocrop", "resize", "match", "format"]
+ImageExtensions = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def loadFrames(paths, size, maxVideoFrames):
+	"""Returns [(name, frame)] for every image and the first maxVideoFrames frames of every video in paths."""
+	files = []
+	for path in paths:
+		files += sorted(glob.glob(os.path.join(path, '*'))) if os.path.isdir(path) else [path]
+
+	frames = []
+	for path in files:
+		if path.lower().endswith(ImageExtensions):
+			img = cv2.imread(path)
+			if img is not None:
+				frames.append((os.path.basename(path), img))
+			continue
+		cam = cv2.VideoCapture(path)
+		index = 0
+		while index < maxVideoFrames:
+			ret, img = cam.read()
+			if not ret:
+				break
+			frames.append(("%s#%d" % (os.path.basename(path), index), img))
+			index += 1
+		cam.release()
+
+	if size is not None:
+		frames = [(name, cv2.resize(img, size)) for name, img in frames]
+	return frames
+
+def processFrame(worker, img, skipUnchanged):
+	if not skipUnchanged:
+		worker.regionFingerprints.clear() # Run every stage on every frame
+	worker.startStages()
+	worker.recognizeScheduled(worker.preprocessFrame(img))
+	worker.formatClocks()
+
+def percentiles(values):
+	values = numpy.asarray(values) * 1000
+	return {
+		"p50": float(numpy.percentile(values, 50)),
+		"p95": float(numpy.percentile(values, 95)),
+		"p99": float(numpy.percentile(values, 99)),
+		"mean": float(values.mean()),
+	}
+
+def measureTimings(worker, frames, repeat, skipUnchanged):
+	stageSamples = dict((stage, []) for stage in Stages)
+	totals = []
+	for i in range(repeat):
+		for name, img in frames:
+			start = time.perf_counter()
+			processFrame(worker, img, skipUnchanged)
+			totals.append(time.perf_counter() - start)
+			for stage in Stages:
+				stageSamples[stage].append(worker.stageTimes.get(stage, 0.0))
+	return totals, stageSamples
+
+def measureAllocations(worker, frames, skipUnchanged):
+	"""Traced allocations of one pass: peak bytes allocated within a frame, and bytes still held after the pass."""
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	peaks = []
+	for name, img in frames:
+		current = tracemalloc.get_traced_memory()[0]
+		tracemalloc.reset_peak()
+		processFrame(worker, img, skipUnchanged)
+		peaks.append(tracemalloc.get_traced_memory()[1] - current)
+	retained = tracemalloc.get_traced_memory()[0] - before
+	tracemalloc.stop()
+	return {
+		"peak_bytes_per_frame_p50": int(numpy.percentile(peaks, 50)),
+		"peak_bytes_per_frame_max": int(max(peaks)),
+		"retained_bytes": int(retained),
+	}
+
+def compareRecognizers(worker, other, frames):
+	"""Reads every digit region of every frame with the worker's recognizer and other.
+	Returns how many accepted readings agree, with the first disagreements.
+	"""
+	agreed = total = 0
+	disagreements = []
+	for name, img in frames:
+		img_processed = worker.preprocessFrame(img)
+		boxes = worker.regionConfig.clipped(*img_processed.shape[:2])[0]
+		regions = [(key, rect, img_processed[slices]) for key, kind, rect, slices in boxes if kind == "digit"]
+		if not regions:
+			continue
+		readings = []
+		for recognizer in (worker.recognizer, other):
+			readings.append([label if distance <= recognizer.maxDistance else None for label, distance in recognizer.recognize(img_processed, regions)])
+		for (key, rect, region), first, second in zip(regions, *readings):
+			total += 1
+			if first == second:
+				agreed += 1
+			elif len(disagreements) < 20:
+				disagreements.append([name, key, first, second])
+	return {
+		"recognizers": [worker.recognizer.name, other.name],
+		"regions": total,
+		"agreed": agreed,
+		"agreement": float(agreed) / total if total else 0.0,
+		"disagreements": disagreements,
+	}
+
+def printReport(report):
+	print("%d frames x %d passes, %.1f fps (%s)" % (report["frames"], report["repeat"], report["fps"], ", ".join("%s=%s" % item for item in sorted(report["options"].items()))))
+	print("%-10s %9s %9s %9s %9s" % ("stage [ms]", "p50", "p95", "p99", "mean"))
+	for stage in Stages + ["total"]:
+		row = report["stages_ms"][stage]
+		print("%-10s %9.3f %9.3f %9.3f %9.3f" % (stage, row["p50"], row["p95"], row["p99"], row["mean"]))
+	allocations = report["allocations"]
+	print("Allocated per frame: p50 %d bytes, max %d bytes. Retained after one pass: %d bytes" % (allocations["peak_bytes_per_frame_p50"], allocations["peak_bytes_per_frame_max"], allocations["retained_bytes"]))
+	comparison = report.get("comparison")
+	if comparison:
+		print("%s vs %s: %d of %d digit readings agree (%.1f%%)" % (comparison["recognizers"][0], comparison["recognizers"][1], comparison["agreed"], comparison["regions"], 100 * comparison["agreement"]))
+		for name, key, first, second in comparison["disagreements"]:
+			print("  %s %s: %r vs %r" % (name, key, first, second))
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Headless OCR pipeline benchmark")
+	parser.add_argument("paths", nargs="*", default=[os.path.join(_applicationPath, 'test_images')], help="images, videos or folders")
+	parser.add_argument("--settings", default=_settingsFilePath, help="settings.ini with the bounding boxes, rotation, erosion and crop")
+	parser.add_argument("--size", default="960x540", help="resize frames to WxH like the webcam, empty to keep their size")
+	parser.add_argument("--repeat", type=int, default=20, help="timed passes over all frames")
+	parser.add_argument("--max-video-frames", type=int, default=300)
+	parser.add_argument("--roi-only", action="store_true", help="override SCroiOnly from the settings")
+	parser.add_argument("--colour-lut", action="store_true", help="override SCcolourLUT from the settings")
+	parser.add_argument("--clock-model", action="store_true", help="override SCclockModel from the settings")
+	parser.add_argument("--recognizer", choices=sorted(recognizerBackends), help="override SCrecognizer from the settings")
+	parser.add_argument("--recognizer-command", help="override SCrecognizerCommand, the helper of the external recognizer")
+	parser.add_argument("--compare", choices=sorted(recognizerBackends), help="recognizer to compare the readings with")
+	parser.add_argument("--skip-unchanged", action="store_true", help="keep change detection on, repeated frames skip recognition")
+	parser.add_argument("--json", help="write the results as JSON to this file, - for stdout")
+	args = parser.parse_args()
+
+	settings = loadWorkerSettings(args.settings)
+	settings["roiOnly"] = settings["roiOnly"] or args.roi_only
+	settings["colourLUT"] = settings["colourLUT"] or args.colour_lut
+	settings["clockModel"] = settings["clockModel"] or args.clock_model
+	settings["recognizer"] = args.recognizer or settings["recognizer"]
+	settings["recognizerCommand"] = args.recognizer_command or settings["recognizerCommand"]
+	settings["captureUnknown"] = False # Measure recognition, not the glyph writer
+	worker = SCOCRWorker(**settings)
+	worker.stageTimes = {}
+
+	size = tuple(int(value) for value in args.size.lower().split("x")) if args.size else None
+	frames = loadFrames(args.paths, size, args.max_video_frames)
+	if not frames:
+		sys.exit("No frames found in " + ", ".join(args.paths))
+
+	worker.recognizer.prepare(30)
+	for name, img in frames: # Warm up geometry, ROI plan and colour table caches
+		processFrame(worker, img, args.skip_unchanged)
+	totals, stageSamples = measureTimings(worker, frames, args.repeat, args.skip_unchanged)
+
+	stagesMs = dict((stage, percentiles(samples)) for stage, samples in stageSamples.items())
+	stagesMs["total"] = percentiles(totals)
+	report = {
+		"frames": len(frames),
+		"repeat": args.repeat,
+		"fps": len(totals) / sum(totals),
+		"stages_ms": stagesMs,
+		"allocations": measureAllocations(worker, frames, args.skip_unchanged),
+		"options": {
+			"rotation": settings["rotation"],
+			"erosion": settings["erosion"],
+			"cropLeft": settings["cropLeft"],
+			"cropTop": settings["cropTop"],
+			"roiOnly": settings["roiOnly"],
+			"colourLUT": settings["colourLUT"],
+			"clockModel": settings["clockModel"],
+			"recognizer": settings["recognizer"],
+			"skipUnchanged": args.skip_unchanged,
+			"size": args.size,
+		},
+		"environment": {
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"opencv": cv2.__version__,
+			"numpy": numpy.__version__,
+			"time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+		},
+	}
+
+	if args.compare:
+		other = createRecognizer(args.compare, settings["recognizerCommand"])
+		other.prepare(30)
+		report["comparison"] = compareRecognizers(worker, other, frames)
+		other.close()
+	worker.recognizer.close()
+
+	if args.json == "-":
+		json.dump(report, sys.stdout, indent=2)
+	else:
+		printReport(report)
+		if args.json:
+			with open(args.json, "w") as f:
+				json.dump(report, f, indent=2)
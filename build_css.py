@@ -0,0 +1,39 @@
+# coding: utf8
+# Builds static/style.css from static/style.less with a LESS compiler and records the sha1 of
+# style.less in its header, so --check and the overlay server can tell when style.css is stale.
+# The compiler command gets the .less path appended and prints the CSS, as lessc does
+# (npm install -g less). Edit style.less, never style.css.
+# Usage: python build_css.py [--lessc lessc] [--check]
+
+import argparse
+import os
+import shlex
+import subprocess
+import sys
+
+from scoreboard_server import _applicationPath, _stylesheetHeader, stylesheetSignature
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Build static/style.css from static/style.less")
+	parser.add_argument("--lessc", default="lessc", help="LESS compiler command, given the .less path and printing the CSS")
+	parser.add_argument("--check", action="store_true", help="only check that style.css was built from the current style.less, exit 1 if not")
+	args = parser.parse_args()
+
+	source, built = stylesheetSignature()
+	if args.check:
+		if source is None or source != built:
+			sys.exit("static/style.css was not built from the current static/style.less, run build_css.py")
+		print("static/style.css is up to date")
+		sys.exit(0)
+
+	lessPath = os.path.join(_applicationPath, 'static', 'style.less')
+	try:
+		css = subprocess.check_output(shlex.split(args.lessc, posix=(os.name != 'nt')) + [lessPath]).decode('utf8')
+	except (subprocess.CalledProcessError, OSError) as e:
+		sys.exit("Could not compile style.less: {}".format(e))
+
+	lines = [_stylesheetHeader % source] + css.replace("\r\n", "\n").rstrip("\n").split("\n")
+	with open(os.path.join(_applicationPath, 'static', 'style.css'), 'wb') as f:
+		f.write(("\r\n".join(lines) + "\r\n").encode('utf8')) # CRLF like style.less
+	print("Built static/style.css from style.less (sha1 %s)" % source)
@@ -0,0 +1,76 @@
+# coding: utf8
+# Checks the precomputed colour table against the HSV + inRange chain on test_images/
+# and times both. The check compares SCOCRWorker.preprocessFrame with and without colourLUT,
+# with the rotation, crop and erosion of settings.ini, full frame and ROI only, and exits 1
+# if a single pixel differs.
+# Usage: python colour_lut_benchmark.py [--settings settings.ini] [--rotation -4] [--iterations 200]
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy
+import cv2
+
+from application import _applicationPath, _settingsFilePath, ScoreboardHSVRanges, SCOCRWorker, colourMaskTable, hsvMask, loadWorkerSettings
+
+
+def hsvChain(img):
+	return hsvMask(cv2.cvtColor(img, cv2.COLOR_BGR2HSV), ScoreboardHSVRanges)
+
+def timePerFrame(function, img, iterations):
+	function(img)
+	timings = []
+	for i in range(iterations):
+		start = time.perf_counter()
+		function(img)
+		timings.append(time.perf_counter() - start)
+	return numpy.median(timings) * 1000
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Colour lookup table correctness check and benchmark")
+	parser.add_argument("--settings", default=_settingsFilePath, help="settings.ini with the bounding boxes, rotation, erosion and crop")
+	parser.add_argument("--rotation", type=int, help="override SCrotation from the settings")
+	parser.add_argument("--iterations", type=int, default=200)
+	args = parser.parse_args()
+
+	start = time.perf_counter()
+	table = colourMaskTable(ScoreboardHSVRanges)
+	print("Table built in %.0f ms, %d bytes" % ((time.perf_counter() - start) * 1000, table.bits.nbytes))
+
+	settings = loadWorkerSettings(args.settings)
+	if args.rotation is not None:
+		settings["rotation"] = args.rotation
+	settings.update(captureUnknown=False, recognizer="templates")
+	workerHSV = SCOCRWorker(**dict(settings, roiOnly=False, colourLUT=False))
+	workerLUT = SCOCRWorker(**dict(settings, roiOnly=False, colourLUT=True))
+	workerROI = SCOCRWorker(**dict(settings, roiOnly=True, colourLUT=True))
+	print("Rotation %d, crop %d, %d, erosion %d" % (workerLUT.rotation, workerLUT.cropLeft, workerLUT.cropTop, workerLUT.erosion))
+
+	failed = False
+	savings = []
+	for path in sorted(glob.glob(os.path.join(_applicationPath, 'test_images', '*'))):
+		img = cv2.imread(path)
+		if img is None:
+			continue
+		img = cv2.resize(img, (960, 540))
+
+		##### TABLE PATH MUST MATCH THE HSV CHAIN EXACTLY, THE ROI-ONLY BOXES TOO #####
+		reference = workerHSV.preprocessFrame(img)
+		mismatched = numpy.count_nonzero(workerLUT.preprocessFrame(img) != reference)
+		inner = workerROI.regionConfig.clipped(*reference.shape[:2])[2]
+		if inner is not None:
+			y0, y1, x0, x1 = inner
+			mismatched += numpy.count_nonzero(workerROI.preprocessFrame(img)[y0:y1, x0:x1] != reference[y0:y1, x0:x1])
+		hsvTime = timePerFrame(hsvChain, img, args.iterations)
+		lutTime = timePerFrame(table.mask, img, args.iterations)
+		savings.append(hsvTime - lutTime)
+		failed = failed or mismatched > 0
+
+		print("%-24s %s mismatched %d px | HSV chain %.2f ms, table %.2f ms" % (os.path.basename(path), "FAILED" if mismatched else "ok    ", mismatched, hsvTime, lutTime))
+
+	if savings:
+		print("Median saving per frame: %.2f ms" % numpy.median(savings))
+	sys.exit(1 if failed else 0)
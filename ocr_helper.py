@@ -0,0 +1,122 @@
+# coding: utf8
+# Recognizer helper process for the "external" backend (ExternalRecognizer in application.py).
+# Prints "ready", then reads batches of digit regions on stdin until it closes and answers
+# each with one JSON line: a digit string, "" for blank or null per region.
+# Request: uint32 count, then per region uint16 height, uint16 width and height*width grayscale
+# bytes, digits dark on white.
+# The ssocr engine starts one ssocr process per batch, that is per frame with regions to read:
+# ssocr has no server mode. The regions arrive cropped, upright and binarised by the worker,
+# so it gets its own ssocr arguments, without the crop, rotate and invert of SCssocrArguments.
+# Usage: python ocr_helper.py [--engine ssocr|templates] [--ssocr-arguments "-a -t 50"] [--delay 0]
+# A frozen build runs it as application --ocr-helper [options].
+
+import argparse
+import json
+import os
+import re
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy
+import cv2
+
+from application import TemplateRecognizer, loadReferenceBank
+
+_ssocrArguments = "-a -t 50" # Fixed mid-grey threshold, the regions are black and white already
+
+
+def readExactly(stream, size):
+	data = b""
+	while len(data) < size:
+		chunk = stream.read(size - len(data))
+		if not chunk:
+			return None
+		data += chunk
+	return data
+
+def readRegions(stream):
+	"""Returns the regions of the next request, None once stdin is closed."""
+	header = readExactly(stream, 4)
+	if header is None:
+		return None
+	regions = []
+	for i in range(struct.unpack("<I", header)[0]):
+		height, width = struct.unpack("<HH", readExactly(stream, 4))
+		regions.append(numpy.frombuffer(readExactly(stream, height * width), dtype=numpy.uint8).reshape(height, width))
+	return regions
+
+def templateEngine():
+	recognizer = TemplateRecognizer(loadReferenceBank())
+	def recognize(regions):
+		inverted = [cv2.threshold(region, 127, 255, cv2.THRESH_BINARY_INV)[1] for region in regions]
+		results = recognizer.recognizeInverted(inverted)
+		return [None if label is None or distance > recognizer.maxDistance else str(label) for label, distance in results]
+	return recognize
+
+def tileRegions(regions):
+	"""Returns one image with the regions side by side, padded to the same height, each followed
+	by a minus sign: ssocr reads the row as one string and the minus signs mark where each region's
+	digits end, including blank ones.
+	"""
+	height = max(region.shape[0] for region in regions)
+	gap = max(height // 4, 4)
+	bar = numpy.full((height, 2 * gap + height // 2), 255, numpy.uint8)
+	bar[height * 7 // 16:height * 9 // 16 + 1, gap:gap + height // 2] = 0 # Wider than minus-ratio 2, read as "-"
+	tiles = []
+	for region in regions:
+		tiles.append(cv2.copyMakeBorder(region, 0, height - region.shape[0], gap, 0, cv2.BORDER_CONSTANT, value=255))
+		tiles.append(bar)
+	return cv2.copyMakeBorder(numpy.hstack(tiles), gap, gap, 0, gap, cv2.BORDER_CONSTANT, value=255)
+
+def ssocrEngine(arguments):
+	"""Tiles each batch into one image and reads it with one ssocr run (a fork per batch)."""
+	path = os.path.join(tempfile.mkdtemp(prefix="ocr_helper"), "regions.png")
+	def recognize(regions):
+		if not regions:
+			return []
+		cv2.imwrite(path, tileRegions(regions))
+		try:
+			output = subprocess.check_output(["ssocr"] + arguments.split() + ["-d", "-1", path]).decode("utf8", "replace")
+		except (subprocess.CalledProcessError, OSError):
+			return [None] * len(regions)
+		fields = re.sub(r"\s", "", output).split("-")
+		if len(fields) != len(regions) + 1 or fields[-1]: # Lost or extra separators, the batch cannot be split
+			return [None] * len(regions)
+		labels = []
+		for field in fields[:-1]:
+			digits = re.findall(r"\d", field)
+			labels.append(digits[0] if len(digits) == 1 else ("" if not field else None))
+		return labels
+	return recognize
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Recognizer helper process for the external backend")
+	parser.add_argument("--engine", choices=["ssocr", "templates"], default="ssocr", help="templates runs the built-in matcher, as a stand-in")
+	parser.add_argument("--ssocr-arguments", default=_ssocrArguments, help="ssocr options for the tiled regions, before -d -1 and the image")
+	parser.add_argument("--delay", type=float, default=0, help="seconds to wait before each reply, to test timeouts")
+	args = parser.parse_args(argv)
+
+	if args.engine == "templates":
+		recognize = templateEngine()
+	else:
+		recognize = ssocrEngine(args.ssocr_arguments)
+
+	stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+	stdout.write(b"ready\n")
+	stdout.flush()
+	while True:
+		regions = readRegions(stdin)
+		if regions is None:
+			break
+		labels = recognize(regions)
+		if args.delay:
+			time.sleep(args.delay)
+		stdout.write(json.dumps(labels).encode("utf8") + b"\n")
+		stdout.flush()
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,580 @@
+# coding: utf8
+# Server core of the overlay, shared by the Twisted server of application.py (WebSocketsWorker)
+# and the asyncio one (asyncio_server.py): the WebSocket broadcast hub, the scoreboard.json
+# poller, the overlay files served from memory and the metrics. Imports neither Twisted nor Qt.
+
+import os
+import sys
+import re
+import time
+import json
+import threading
+import queue
+import bisect
+import itertools
+import struct
+import hashlib
+import gzip
+import urllib.parse
+
+import requests
+
+if getattr(sys, 'frozen', False):
+	_applicationPath = os.path.dirname(sys.executable)
+elif __file__:
+	_applicationPath = os.path.dirname(__file__)
+
+
+def mergeUpdate(target, update):
+	"""Merges the nested dict update into target in place, later values win."""
+	for key, value in update.items():
+		if isinstance(value, dict):
+			if not isinstance(target.get(key), dict):
+				target[key] = {}
+			mergeUpdate(target[key], value)
+		else:
+			target[key] = value
+	return target
+
+def updateDelta(state, update):
+	"""Returns the parts of the nested dict update that differ from state, empty if nothing changed."""
+	delta = {}
+	for key, value in update.items():
+		if isinstance(value, dict) and isinstance(state.get(key), dict):
+			_changed = updateDelta(state[key], value)
+			if _changed:
+				delta[key] = _changed
+		elif key not in state or state[key] != value:
+			delta[key] = value
+	return delta
+
+
+class Histogram(object):
+	"""Cumulative latency histogram in seconds, Prometheus style."""
+	buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+	def __init__(self):
+		self.counts = [0] * (len(self.buckets) + 1) # Last one is +Inf
+		self.sum = 0.0
+		self.count = 0
+
+	def observe(self, value):
+		self.counts[bisect.bisect_left(self.buckets, value)] += 1
+		self.sum += value
+		self.count += 1
+
+	def cumulative(self):
+		return [(str(le), n) for le, n in zip(list(self.buckets) + ["+Inf"], itertools.accumulate(self.counts))]
+
+
+class MetricsRegistry(object):
+	"""Counters, gauges and histograms shared by the workers and served as /metrics.
+	Collectors are called with the registry before every snapshot, to copy counters
+	that are cheaper to keep as plain attributes.
+	"""
+	def __init__(self):
+		self._lock = threading.Lock()
+		self.values = {} # (name, labels) -> counter or gauge value
+		self.histograms = {} # (name, labels) -> Histogram
+		self.descriptions = {} # name -> (type, help)
+		self.collectors = []
+
+	def describe(self, name, kind, text):
+		self.descriptions[name] = (kind, text)
+
+	def increment(self, name, amount=1, **labels):
+		_key = (name, tuple(sorted(labels.items())))
+		with self._lock:
+			self.values[_key] = self.values.get(_key, 0) + amount
+
+	def set(self, name, value, **labels):
+		with self._lock:
+			self.values[(name, tuple(sorted(labels.items())))] = value
+
+	def observe(self, name, value, **labels):
+		_key = (name, tuple(sorted(labels.items())))
+		with self._lock:
+			if _key not in self.histograms:
+				self.histograms[_key] = Histogram()
+			self.histograms[_key].observe(value)
+
+	def addCollector(self, collector):
+		self.collectors.append(collector)
+
+	def removeCollector(self, collector):
+		if collector in self.collectors:
+			self.collectors.remove(collector)
+
+	def collect(self):
+		for collector in list(self.collectors):
+			collector(self)
+
+	def snapshot(self):
+		"""Returns {name: [{"labels", "value"} or {"labels", "count", "sum", "buckets"}]} for JSON."""
+		self.collect()
+		result = {}
+		with self._lock:
+			for (name, labels), value in sorted(self.values.items()):
+				result.setdefault(name, []).append({"labels": dict(labels), "value": value})
+			for (name, labels), histogram in sorted(self.histograms.items()):
+				result.setdefault(name, []).append({"labels": dict(labels), "count": histogram.count, "sum": histogram.sum, "buckets": dict(histogram.cumulative())})
+		return result
+
+	def text(self):
+		"""Returns the Prometheus text exposition format."""
+		lines = []
+		for name, samples in self.snapshot().items():
+			kind, text = self.descriptions.get(name, ("untyped", name))
+			lines.append("# HELP %s %s" % (name, text))
+			lines.append("# TYPE %s %s" % (name, kind))
+			for sample in samples:
+				_labels = ",".join('%s="%s"' % item for item in sorted(sample["labels"].items()))
+				if "buckets" not in sample:
+					lines.append("%s%s %s" % (name, "{%s}" % _labels if _labels else "", sample["value"]))
+					continue
+				for le, count in sample["buckets"].items():
+					lines.append('%s_bucket{%s} %d' % (name, ",".join(filter(None, [_labels, 'le="%s"' % le])), count))
+				lines.append("%s_sum%s %s" % (name, "{%s}" % _labels if _labels else "", repr(sample["sum"])))
+				lines.append("%s_count%s %d" % (name, "{%s}" % _labels if _labels else "", sample["count"]))
+		return "\n".join(lines) + "\n"
+
+
+##### OVERLAY ASSETS #####
+_assetTypes = { # Served extensions under static/, the allowlist of the overlay web server
+	".css": "text/css; charset=utf-8",
+	".js": "application/javascript; charset=utf-8",
+	".woff": "font/woff",
+	".woff2": "font/woff2",
+	".ttf": "font/ttf",
+	".otf": "font/otf",
+	".png": "image/png",
+	".jpg": "image/jpeg",
+	".jpeg": "image/jpeg",
+	".gif": "image/gif",
+	".svg": "image/svg+xml",
+}
+_compressedAssetTypes = (".html", ".css", ".js", ".ttf", ".otf", ".svg") # woff and images are compressed already
+_assetReference = re.compile(r"""(?<![\w/.])(/?static/[\w./-]+)""") # static/ links in index.html and the CSS
+_stylesheetHeader = "/* Built from style.less (sha1 %s) by build_css.py, do not edit by hand */"
+_stylesheetSource = re.compile(r"^/\* Built from style\.less \(sha1 ([0-9a-f]{40})\)")
+
+def stylesheetSignature(root=_applicationPath):
+	"""Returns (sha1 of static/style.less, sha1 recorded in the header of static/style.css), None
+	for a missing file or header. Line endings are normalised, a checkout may convert them.
+	"""
+	try:
+		with open(os.path.join(root, 'static', 'style.less'), 'rb') as f:
+			source = hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+	except (IOError, OSError):
+		source = None
+	try:
+		with open(os.path.join(root, 'static', 'style.css'), 'rb') as f:
+			_match = _stylesheetSource.match(f.readline().decode('ascii', 'replace'))
+	except (IOError, OSError):
+		_match = None
+	return source, _match.group(1) if _match else None
+
+##### GAME CLOCK FRAMES #####
+_gameFrameProtocol = "scoreboard.bin" # WebSocket subprotocol of clients that take binary clock frames
+_gameFrame = struct.Struct("<BBId6s4s") # Type, flags, sequence, capture time, clock, shot clock: 24 bytes
+_gameFrameType = 1
+
+def encodeGameFrame(sequence, capturedAt, clock, shotClock):
+	"""Returns the binary frame of the clocks, decoded by index.html. Clocks are ASCII, NUL padded."""
+	return _gameFrame.pack(_gameFrameType, 0, sequence & 0xFFFFFFFF, capturedAt, str(clock).encode('ascii', 'replace')[:6], str(shotClock).encode('ascii', 'replace')[:4])
+
+def decodeGameFrame(payload):
+	"""Returns (sequence, capture time, clock, shot clock) of an encodeGameFrame payload."""
+	frameType, flags, sequence, capturedAt, clock, shotClock = _gameFrame.unpack(payload)
+	return sequence, capturedAt, clock.rstrip(b"\0").decode('ascii'), shotClock.rstrip(b"\0").decode('ascii')
+
+_scoreboardFeedURL = "http://www.choxue.com/zh-tw/livedash/{gameID}/scoreboard.json"
+
+class ScoreboardFeedPoller(object):
+	"""Polls the scoreboard.json of the current gameID once for all overlays and hands the
+	changed fields to publish. Uses one keep-alive requests.Session and conditional requests
+	with the last ETag / Last-Modified, so an unchanged feed costs a 304. After a failure the
+	delay doubles up to maxBackoff seconds.
+	"""
+	def __init__(self, publish, urlTemplate=_scoreboardFeedURL, interval=1.5, timeout=3.0, maxBackoff=30.0):
+		self.publish = publish # Called with a nested dict of the changed fields, from the poller thread
+		self.urlTemplate = urlTemplate
+		self.interval = interval
+		self.timeout = timeout
+		self.maxBackoff = maxBackoff
+		self.gameID = ""
+		self.model = {} # Feed of gameID as published so far
+		self.etag = None
+		self.lastModified = None
+		self.backoff = 0.0 # Seconds to the next poll after failures, 0 when upstream is fine
+		self.requests = 0
+		self.notModified = 0
+		self.failures = 0
+		self.updates = 0
+		self.lastError = ""
+		self.session = requests.Session()
+		for _scheme in ("http://", "https://"):
+			self.session.mount(_scheme, requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+		self.session.headers["Accept"] = "application/json"
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._stop = threading.Event()
+		self._thread = None
+
+	def setGameID(self, gameID):
+		"""Switches the feed, polling the new one right away. An empty gameID pauses polling."""
+		gameID = str(gameID).strip()
+		with self._lock:
+			if gameID == self.gameID:
+				return
+			self.gameID = gameID
+			self.model = {}
+			self.etag = self.lastModified = None
+			self.backoff = 0.0
+		self._wake.set()
+
+	def start(self):
+		self._thread = threading.Thread(target=self.run, name="ScoreboardFeedPoller", daemon=True)
+		self._thread.start()
+
+	def run(self):
+		while not self._stop.is_set():
+			_delay = self.poll() if self.gameID else None # None: sleep until setGameID
+			self._wake.wait(_delay)
+			self._wake.clear()
+
+	def close(self):
+		self._stop.set()
+		self._wake.set()
+		if self._thread is not None:
+			self._thread.join(self.timeout + 1)
+		self.session.close()
+
+	def poll(self):
+		"""Fetches the feed once and publishes what changed. Returns the seconds until the next poll."""
+		with self._lock:
+			gameID, etag, lastModified = self.gameID, self.etag, self.lastModified
+		headers = {}
+		if etag:
+			headers["If-None-Match"] = etag
+		if lastModified:
+			headers["If-Modified-Since"] = lastModified
+		self.requests += 1
+		try:
+			response = self.session.get(self.urlTemplate.format(gameID=urllib.parse.quote(gameID, safe="")), headers=headers, timeout=self.timeout)
+			if response.status_code == 304:
+				self.notModified += 1
+			else:
+				response.raise_for_status()
+				model = response.json()
+				if not isinstance(model, dict):
+					raise ValueError("scoreboard.json is not an object")
+				with self._lock:
+					if gameID != self.gameID: # Switched while fetching
+						return 0
+					_delta = updateDelta(self.model, model)
+					mergeUpdate(self.model, _delta)
+					self.etag = response.headers.get("ETag")
+					self.lastModified = response.headers.get("Last-Modified")
+				if _delta:
+					self.updates += 1
+					self.publish(_delta)
+		except (requests.RequestException, ValueError) as e:
+			self.failures += 1
+			self.lastError = str(e)
+			self.backoff = min(self.maxBackoff, max(self.interval, self.backoff * 2))
+			return self.backoff
+		self.backoff = 0.0
+		return self.interval
+
+	def collectMetrics(self, metrics):
+		metrics.set("scoreboard_feed_requests_total", self.requests)
+		metrics.set("scoreboard_feed_not_modified_total", self.notModified)
+		metrics.set("scoreboard_feed_failures_total", self.failures)
+		metrics.set("scoreboard_feed_updates_total", self.updates)
+		metrics.set("scoreboard_feed_backoff_seconds", self.backoff)
+
+
+class ScoreboardBroadcast(object):
+	"""Clients, merged state and the publish queue of the WebSocket server, shared by the Twisted
+	factory of WebSocketsWorker and AsyncioWebSocketsServer. Clients need peer, paused, stale,
+	binary and sendMessage(payload, isBinary, doNotCompress). Everything but queue() runs on the
+	server's event loop.
+	"""
+	def __init__(self):
+		self.clients = set()
+		self.state = {} # Everything published so far, merged. New and lagging clients get it whole
+		self.publishInterval = 0.04 # Seconds between two drains of the publish queue
+		self.clientBufferLimit = 64 * 1024 # Bytes waiting on a client's transport before it is skipped
+		self.skippedMessages = 0 # Deltas not sent to lagging clients
+		self.messagesSent = 0
+		self.bytesSent = 0
+		self.gameSequence = 0 # Clock frames built
+		self.capturedAt = 0.0 # Capture time of the newest frame the clocks were read from
+		self.binaryFramesSent = 0
+		self.updates = queue.SimpleQueue() # (update, capture time) queued since the last drain
+
+	def register(self, client):
+		if client not in self.clients:
+			print(("registered client {}".format(client.peer)))
+			self.clients.add(client)
+			if self.state:
+				self.sendState(client)
+
+	def unregister(self, client):
+		if client in self.clients:
+			print(("unregistered client {}".format(client.peer)))
+			self.clients.discard(client)
+
+	def broadcast(self, msg):
+		#print("broadcasting message '{}' ..".format(msg))
+		_payload = msg.encode('utf8')
+		for c in list(self.clients):
+			if not c.paused:
+				c.sendMessage(_payload)
+				self.messagesSent += 1
+				self.bytesSent += len(_payload)
+			#print("message {} sent to {}".format(msg, c.peer))
+
+	def queue(self, update, capturedAt=None):
+		"""Queues a nested dict update for the next publish. Safe to call from any thread, never
+		blocks or wakes the server. capturedAt is the capture time of the frame the clocks in update
+		were read from.
+		"""
+		self.updates.put((update, capturedAt))
+
+	def drain(self):
+		"""Returns the updates queued before this call, merged in order."""
+		pending = {}
+		for i in range(self.updates.qsize()):
+			update, capturedAt = self.updates.get_nowait()
+			mergeUpdate(pending, update)
+			if capturedAt is not None:
+				self.capturedAt = capturedAt
+		return pending
+
+	def sendState(self, client):
+		client.stale = False
+		_payload = json.dumps(self.state).encode('utf8')
+		client.sendMessage(_payload)
+		self.messagesSent += 1
+		self.bytesSent += len(_payload)
+
+	def publish(self):
+		"""Sends the fields changed since the last drain as one message.
+		Clients whose transport buffer is full are skipped and get the full state once it drains.
+		"""
+		_delta = updateDelta(self.state, self.drain())
+		if not _delta:
+			return
+		mergeUpdate(self.state, _delta)
+		_payload = json.dumps(_delta).encode('utf8')
+		_frame = _rest = None
+		_clocks = set(_delta.get("game", {})) & set(("clock", "shot_clock"))
+		if _clocks and any(c.binary for c in self.clients):
+			self.gameSequence += 1
+			_game = self.state["game"]
+			_frame = encodeGameFrame(self.gameSequence, self.capturedAt or time.time(), _game.get("clock", ""), _game.get("shot_clock", ""))
+			_others = dict((key, value) for key, value in _delta["game"].items() if key not in _clocks)
+			_rest = dict((key, value) for key, value in _delta.items() if key != "game")
+			if _others:
+				_rest["game"] = _others
+			_rest = json.dumps(_rest).encode('utf8') if _rest else None
+		for c in list(self.clients):
+			if c.paused:
+				c.stale = True
+				self.skippedMessages += 1
+			elif c.stale:
+				self.sendState(c)
+			elif c.binary and _frame is not None:
+				c.sendMessage(_frame, isBinary=True, doNotCompress=True)
+				self.binaryFramesSent += 1
+				self.messagesSent += 1
+				self.bytesSent += len(_frame)
+				if _rest is not None:
+					c.sendMessage(_rest)
+					self.messagesSent += 1
+					self.bytesSent += len(_rest)
+			else:
+				c.sendMessage(_payload)
+				self.messagesSent += 1
+				self.bytesSent += len(_payload)
+
+	def collectMetrics(self, metrics):
+		metrics.set("scoreboard_ws_clients", len(self.clients))
+		metrics.set("scoreboard_ws_binary_clients", sum(1 for c in self.clients if c.binary))
+		metrics.set("scoreboard_ws_binary_frames_sent_total", self.binaryFramesSent)
+		metrics.set("scoreboard_ws_publish_queue_depth", self.updates.qsize())
+		metrics.set("scoreboard_ws_messages_sent_total", self.messagesSent)
+		metrics.set("scoreboard_ws_bytes_sent_total", self.bytesSent)
+		metrics.set("scoreboard_ws_skipped_messages_total", self.skippedMessages)
+
+	def returnClients(self):
+		return
+		#for c in self.clients:
+			#print(c.peer)
+
+def serverMetrics(broadcast, feed, assets):
+	"""Returns the MetricsRegistry served as /metrics and shared with SCOCRWorker."""
+	metrics = MetricsRegistry()
+	metrics.describe("scoreboard_ws_clients", "gauge", "Connected WebSocket clients")
+	metrics.describe("scoreboard_ws_binary_clients", "gauge", "Connected WebSocket clients taking binary clock frames")
+	metrics.describe("scoreboard_ws_binary_frames_sent_total", "counter", "Binary clock frames sent, per client")
+	metrics.describe("scoreboard_ws_publish_queue_depth", "gauge", "Updates waiting for the next publish tick")
+	metrics.describe("scoreboard_ws_messages_sent_total", "counter", "WebSocket messages sent, per client")
+	metrics.describe("scoreboard_ws_bytes_sent_total", "counter", "WebSocket payload bytes sent")
+	metrics.describe("scoreboard_ws_skipped_messages_total", "counter", "Deltas not sent to clients over the buffer limit")
+	metrics.describe("scoreboard_feed_requests_total", "counter", "scoreboard.json requests")
+	metrics.describe("scoreboard_feed_not_modified_total", "counter", "scoreboard.json requests answered 304 Not Modified")
+	metrics.describe("scoreboard_feed_failures_total", "counter", "Failed scoreboard.json requests")
+	metrics.describe("scoreboard_feed_updates_total", "counter", "scoreboard.json responses with changed fields")
+	metrics.describe("scoreboard_feed_backoff_seconds", "gauge", "Delay before the next scoreboard.json request after failures")
+	metrics.describe("scoreboard_http_assets", "gauge", "Overlay files served from memory")
+	metrics.describe("scoreboard_http_asset_rebuilds_total", "counter", "Rebuilds of the overlay files after a source changed")
+	metrics.describe("scoreboard_http_asset_requests_total", "counter", "Overlay file requests served")
+	metrics.describe("scoreboard_http_not_modified_total", "counter", "Overlay file requests answered 304 Not Modified")
+	metrics.addCollector(broadcast.collectMetrics)
+	metrics.addCollector(feed.collectMetrics)
+	metrics.addCollector(assets.collectMetrics)
+	return metrics
+
+
+class OverlayAssets(object):
+	"""Serves index.html and the allowlisted files under static/ from memory, gzip-compressed
+	when the browser accepts it, with strong ETags. static/style.css is built from style.less
+	by build_css.py and committed, a warning is printed when it is out of date. Links to static
+	files in index.html and the CSS get ?v=<version>, and versioned requests are cached for a
+	year. Sources are checked at most every checkInterval seconds and changed ones are rebuilt.
+	render_GET takes a twisted.web request, or anything with its path, args, getHeader,
+	setHeader and setResponseCode.
+	"""
+	def __init__(self, root=_applicationPath, checkInterval=1.0):
+		self.root = root
+		self.checkInterval = checkInterval
+		self.assets = {} # URL path -> {"data", "gzip", "etag", "version", "type", "immutable"}
+		self.signatures = {} # URL path -> (source path, mtime_ns, size)
+		self.checked = 0.0
+		self.rebuilds = 0
+		self.hits = 0
+		self.notModified = 0
+
+	def sources(self):
+		"""Returns {URL path: source path} of the allowlist."""
+		sources = {"/index.html": os.path.join(self.root, 'index.html')}
+		for directory, subdirectories, files in os.walk(os.path.join(self.root, 'static')):
+			for name in files:
+				path = os.path.join(directory, name)
+				url = "/" + os.path.relpath(path, self.root).replace(os.sep, "/")
+				if os.path.splitext(name)[1].lower() in _assetTypes:
+					sources[url] = path
+		return sources
+
+	def refresh(self):
+		"""Rebuilds the assets if a source changed, appeared or disappeared. Returns True if it did."""
+		now = time.monotonic()
+		if self.assets and now - self.checked < self.checkInterval:
+			return False
+		self.checked = now
+		signatures = {}
+		for url, path in self.sources().items():
+			try:
+				_stat = os.stat(path)
+			except OSError:
+				continue
+			signatures[url] = (path, _stat.st_mtime_ns, _stat.st_size)
+		if signatures == self.signatures:
+			return False
+
+		raw = {}
+		for url, (path, mtime, size) in signatures.items():
+			_previous = self.assets.get(url)
+			if _previous is not None and self.signatures.get(url) == signatures[url] and not url.endswith((".html", ".css")):
+				raw[url] = _previous["data"]
+				continue
+			try:
+				with open(path, 'rb') as f:
+					raw[url] = f.read()
+			except (IOError, OSError):
+				continue
+		versions = dict((url, hashlib.sha1(data).hexdigest()[:16]) for url, data in raw.items())
+
+		def versioned(match):
+			_url = "/" + match.group(1).lstrip("/")
+			return match.group(1) + "?v=" + versions[_url] if _url in versions else match.group(1)
+
+		assets = {}
+		for url, data in raw.items():
+			if url.endswith((".html", ".css")):
+				data = _assetReference.sub(versioned, data.decode('utf8')).encode('utf8')
+			_etag = hashlib.sha1(data).hexdigest()[:16]
+			_previous = self.assets.get(url)
+			assets[url] = {
+				"data": data,
+				"gzip": (_previous["gzip"] if _previous is not None and _previous["etag"] == _etag else gzip.compress(data, 9, mtime=0)) if url.endswith(_compressedAssetTypes) else None,
+				"etag": _etag,
+				"version": versions[url],
+				"type": "text/html; charset=utf-8" if url.endswith(".html") else _assetTypes[os.path.splitext(url)[1].lower()],
+				"immutable": url != "/index.html",
+			}
+		self.assets = assets
+		self.signatures = signatures
+		self.rebuilds += 1
+		source, built = stylesheetSignature(self.root)
+		if source is not None and source != built:
+			print("static/style.css was not built from the current static/style.less, run build_css.py")
+		return True
+
+	def render_GET(self, request):
+		self.refresh()
+		path = request.path.decode('utf8', 'replace')
+		asset = self.assets.get("/index.html" if path == "/" else path)
+		if asset is None:
+			request.setResponseCode(404)
+			request.setHeader(b"Content-Type", b"text/plain")
+			return b"Not found"
+		self.hits += 1
+
+		data = asset["data"]
+		etag = '"%s"' % asset["etag"]
+		if asset["gzip"] is not None:
+			request.setHeader(b"Vary", b"Accept-Encoding")
+			if b"gzip" in (request.getHeader(b"accept-encoding") or b""):
+				data = asset["gzip"]
+				etag = '"%s-gz"' % asset["etag"]
+				request.setHeader(b"Content-Encoding", b"gzip")
+		request.setHeader(b"Content-Type", asset["type"].encode('ascii'))
+		request.setHeader(b"ETag", etag.encode('ascii'))
+		if asset["immutable"] and request.args.get(b"v") == [asset["version"].encode('ascii')]:
+			request.setHeader(b"Cache-Control", b"public, max-age=31536000, immutable")
+		else:
+			request.setHeader(b"Cache-Control", b"no-cache") # Revalidated with the ETag, a 304 when unchanged
+
+		_match = request.getHeader(b"if-none-match")
+		if _match is not None and (_match.strip() == b"*" or etag.encode('ascii') in [tag.strip() for tag in _match.split(b",")]):
+			self.notModified += 1
+			request.setResponseCode(304)
+			return b""
+		request.setHeader(b"Content-Length", str(len(data)).encode('ascii'))
+		return data
+
+	def collectMetrics(self, metrics):
+		metrics.set("scoreboard_http_assets", len(self.assets))
+		metrics.set("scoreboard_http_asset_rebuilds_total", self.rebuilds)
+		metrics.set("scoreboard_http_asset_requests_total", self.hits)
+		metrics.set("scoreboard_http_not_modified_total", self.notModified)
+
+
+class MetricsPage(object):
+	"""GET /metrics: Prometheus text, or JSON with ?format=json or Accept: application/json.
+	render_GET takes the same requests as OverlayAssets.render_GET.
+	"""
+	def __init__(self, metrics):
+		self.metrics = metrics
+
+	def render_GET(self, request):
+		request.setHeader(b"Cache-Control", b"no-cache")
+		if request.args.get(b"format") == [b"json"] or b"application/json" in (request.getHeader(b"accept") or b""):
+			request.setHeader(b"Content-Type", b"application/json")
+			return json.dumps(self.metrics.snapshot()).encode('utf8')
+		request.setHeader(b"Content-Type", b"text/plain; version=0.0.4")
+		return self.metrics.text().encode('utf8')
@@ -0,0 +1,138 @@
+# coding: utf8
+# Load test of AsyncioWebSocketsServer on its own, without a camera or GUI: a thread publishes
+# clock updates like SCOCRWorker while WebSocket clients (half of them taking scoreboard.bin
+# clock frames) read them, then reports delivered messages, bytes and capture-to-client latency.
+# Usage: python server_loadtest.py [--clients 20] [--rate 25] [--duration 10] [--ws-port 9100]
+
+import argparse
+import asyncio
+import base64
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+
+import numpy
+
+from asyncio_server import AsyncioWebSocketsServer
+from scoreboard_server import decodeGameFrame
+
+
+class Client(object):
+	def __init__(self, binary):
+		self.binary = binary
+		self.messages = 0
+		self.frames = 0
+		self.bytes = 0
+		self.latencies = []
+		self.gaps = 0 # Clock frames missed, from the sequence numbers
+		self.lastSequence = None
+
+	async def run(self, port, deflate, stop):
+		reader, writer = await asyncio.open_connection("127.0.0.1", port)
+		request = [
+			"GET / HTTP/1.1",
+			"Host: 127.0.0.1:%d" % port,
+			"Upgrade: websocket",
+			"Connection: Upgrade",
+			"Sec-WebSocket-Key: " + base64.b64encode(os.urandom(16)).decode('ascii'),
+			"Sec-WebSocket-Version: 13",
+		]
+		if self.binary:
+			request.append("Sec-WebSocket-Protocol: scoreboard.bin")
+		if deflate:
+			request.append("Sec-WebSocket-Extensions: permessage-deflate")
+		writer.write(("\r\n".join(request) + "\r\n\r\n").encode('ascii'))
+		response = await reader.readuntil(b"\r\n\r\n")
+		if not response.startswith(b"HTTP/1.1 101"):
+			raise RuntimeError(response.decode('latin-1'))
+		inflater = zlib.decompressobj(-15) # The server keeps its compression context across messages
+		try:
+			while not stop.is_set():
+				head = await reader.readexactly(2)
+				length = head[1] & 0x7F
+				if length == 126:
+					length = struct.unpack("!H", await reader.readexactly(2))[0]
+				elif length == 127:
+					length = struct.unpack("!Q", await reader.readexactly(8))[0]
+				payload = await reader.readexactly(length)
+				self.bytes += 2 + length
+				if head[0] & 0x40:
+					payload = inflater.decompress(payload + b"\x00\x00\xff\xff")
+				if (head[0] & 0x0F) == 0x2 and self.binary:
+					sequence, capturedAt, clock, shotClock = decodeGameFrame(payload)
+					self.latencies.append(time.time() - capturedAt)
+					if self.lastSequence is not None:
+						self.gaps += sequence - self.lastSequence - 1
+					self.lastSequence = sequence
+					self.frames += 1
+				self.messages += 1
+		except asyncio.IncompleteReadError:
+			pass
+		finally:
+			writer.close()
+
+def publishClocks(server, rate, duration):
+	"""Publishes a running clock at rate updates per second, stamped with the time as capture time."""
+	start = time.time()
+	count = 0
+	while time.time() - start < duration:
+		tenths = int(7200 - count * 10 / rate)
+		clock = "%02d:%02d" % (tenths // 600, tenths // 10 % 60) if tenths >= 600 else "%d.%d" % (tenths // 10, tenths % 10)
+		server.publish({"game": {"clock": clock, "shot_clock": str(24 - count % 24)}}, time.time()) # As gamePacket in application.py
+		count += 1
+		time.sleep(max(0, start + count / rate - time.time()))
+	return count
+
+async def runClients(clients, port, deflate, duration):
+	stop = asyncio.Event()
+	tasks = [asyncio.ensure_future(client.run(port, deflate, stop)) for client in clients]
+	await asyncio.sleep(duration + 0.5)
+	stop.set()
+	for task in tasks:
+		task.cancel()
+	await asyncio.gather(*tasks, return_exceptions=True)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="AsyncioWebSocketsServer load test")
+	parser.add_argument("--clients", type=int, default=20)
+	parser.add_argument("--binary-share", type=float, default=0.5, help="share of the clients taking binary clock frames")
+	parser.add_argument("--rate", type=float, default=25, help="clock updates published per second")
+	parser.add_argument("--duration", type=float, default=10, help="seconds to publish")
+	parser.add_argument("--no-deflate", action="store_true", help="do not offer permessage-deflate")
+	parser.add_argument("--ws-port", type=int, default=9100)
+	parser.add_argument("--http-port", type=int, default=8180)
+	args = parser.parse_args()
+
+	server = AsyncioWebSocketsServer(webSocketPort=args.ws_port, httpPort=args.http_port)
+	try:
+		server.start()
+	except OSError as e:
+		sys.exit("Could not start the server: {}".format(e))
+
+	binaryClients = int(round(args.clients * args.binary_share))
+	clients = [Client(i < binaryClients) for i in range(args.clients)]
+	results = {}
+	publisher = threading.Thread(target=lambda: results.update(published=publishClocks(server, args.rate, args.duration)))
+	cpuStart = time.process_time()
+	loader = threading.Thread(target=lambda: (time.sleep(0.5), publisher.start()))
+	loader.start()
+	asyncio.run(runClients(clients, args.ws_port, not args.no_deflate, args.duration))
+	publisher.join()
+	cpu = time.process_time() - cpuStart
+	server.stop()
+	server.wait(2000)
+
+	print("%d updates published at %.0f/s to %d clients, %.1f s CPU for server, clients and publisher" % (results["published"], args.rate, args.clients, cpu))
+	for binary in (True, False):
+		group = [client for client in clients if client.binary == binary]
+		if not group:
+			continue
+		print("%-6s clients: %5d messages, %7d bytes per client" % ("binary" if binary else "JSON", numpy.mean([client.messages for client in group]), numpy.mean([client.bytes for client in group])))
+		latencies = numpy.concatenate([client.latencies for client in group]) * 1000 if binary else []
+		if len(latencies):
+			print("        capture to client latency p50 %.1f ms, p99 %.1f ms, %d clock frames missed" % (numpy.percentile(latencies, 50), numpy.percentile(latencies, 99), sum(client.gaps for client in group)))
+	snapshot = server.metrics.snapshot()
+	print("server: %d messages, %d payload bytes sent, %d skipped" % tuple(snapshot[name][0]["value"] for name in ("scoreboard_ws_messages_sent_total", "scoreboard_ws_bytes_sent_total", "scoreboard_ws_skipped_messages_total")))
@@ -0,0 +1,223 @@
+# coding: utf8
+# Protocol checks of AsyncioWebSocketsServer with raw frames: fragmented messages, control frames
+# inside them, permessage-deflate with context takeover, the close handshake, and the close codes
+# for oversize (1009), malformed (1002) and non-UTF-8 (1007) messages. Exits 1 if a check fails.
+# Usage: python websocket_selftest.py [--ws-port 9200] [--http-port 8280]
+
+import argparse
+import asyncio
+import base64
+import os
+import struct
+import sys
+import zlib
+
+from asyncio_server import AsyncioWebSocketsServer
+
+
+class Client(object):
+	"""Raw WebSocket client sending frames exactly as given."""
+	async def connect(self, port, deflate=False):
+		self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+		request = [
+			"GET / HTTP/1.1",
+			"Host: 127.0.0.1:%d" % port,
+			"Upgrade: websocket",
+			"Connection: Upgrade",
+			"Sec-WebSocket-Key: " + base64.b64encode(os.urandom(16)).decode('ascii'),
+			"Sec-WebSocket-Version: 13",
+		]
+		if deflate:
+			request.append("Sec-WebSocket-Extensions: permessage-deflate")
+		self.writer.write(("\r\n".join(request) + "\r\n\r\n").encode('ascii'))
+		response = await self.reader.readuntil(b"\r\n\r\n")
+		if not response.startswith(b"HTTP/1.1 101"):
+			raise RuntimeError(response.decode('latin-1'))
+		self.deflate = b"permessage-deflate" in response
+		self.inflater = zlib.decompressobj(-15) # The server keeps its compression context across messages
+		return self
+
+	def send(self, opcode, payload, final=True, rsv1=False, masked=True, length=None):
+		"""Sends one frame, length overrides the length in the header (the payload is sent as is)."""
+		length = len(payload) if length is None else length
+		first = (0x80 if final else 0) | (0x40 if rsv1 else 0) | opcode
+		maskBit = 0x80 if masked else 0
+		if length < 126:
+			header = struct.pack("!BB", first, maskBit | length)
+		elif length < 65536:
+			header = struct.pack("!BBH", first, maskBit | 126, length)
+		else:
+			header = struct.pack("!BBQ", first, maskBit | 127, length)
+		if masked:
+			mask = os.urandom(4)
+			payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+			header += mask
+		self.writer.write(header + payload)
+
+	async def read(self, timeout=2.0):
+		"""Returns (opcode, payload) of the next server frame, inflated, or None at the end of the stream."""
+		try:
+			head = await asyncio.wait_for(self.reader.readexactly(2), timeout)
+			length = head[1] & 0x7F
+			if length == 126:
+				length = struct.unpack("!H", await self.reader.readexactly(2))[0]
+			elif length == 127:
+				length = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+			payload = await self.reader.readexactly(length)
+		except (asyncio.IncompleteReadError, ConnectionError):
+			return None
+		if head[0] & 0x40:
+			payload = self.inflater.decompress(payload + b"\x00\x00\xff\xff")
+		return head[0] & 0x0F, payload
+
+	async def expect(self, opcode):
+		"""Returns the payload of the next frame of opcode, skipping others. Fails on a close or the end of the stream."""
+		while True:
+			frame = await self.read()
+			if frame is None or (frame[0] == 0x8 and opcode != 0x8):
+				raise AssertionError("expected opcode %d, got %r" % (opcode, frame))
+			if frame[0] == opcode:
+				return frame[1]
+
+	async def closeCode(self):
+		"""Returns the code of the server's close frame, after checking that the server then ends the stream."""
+		payload = await self.expect(0x8)
+		if await self.read() is not None:
+			raise AssertionError("frame after the close frame")
+		return struct.unpack("!H", payload[:2])[0]
+
+	def close(self):
+		self.writer.close()
+
+def deflated(compressor, payload):
+	return (compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+
+def expectEqual(actual, expected):
+	if actual != expected:
+		raise AssertionError("expected %r, got %r" % (expected, actual))
+
+
+async def fragmentedText(port):
+	c = await Client().connect(port)
+	c.send(0x1, b"hel", final=False)
+	c.send(0x0, b"lo ", final=False)
+	c.send(0x0, b"world")
+	expectEqual((await c.expect(0x1)).split(b" from ")[0], b"hello world")
+	c.close()
+
+async def pingInsideFragments(port):
+	c = await Client().connect(port)
+	c.send(0x1, b"ab", final=False)
+	c.send(0x9, b"p1")
+	c.send(0xA, b"unsolicited")
+	c.send(0x0, b"cd")
+	expectEqual(await c.expect(0xA), b"p1")
+	expectEqual((await c.expect(0x1)).split(b" from ")[0], b"abcd")
+	c.close()
+
+async def compressedWithContextTakeover(port):
+	c = await Client().connect(port, deflate=True)
+	expectEqual(c.deflate, True)
+	compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+	text = b"scoreboard " * 20
+	for i in range(2): # The second message refers back to the first through the shared window
+		payload = deflated(compressor, text)
+		c.send(0x1, payload[:5], final=False, rsv1=True)
+		c.send(0x0, payload[5:])
+		expectEqual((await c.expect(0x1)).split(b" from ")[0], text)
+	c.close()
+
+async def closeHandshake(port):
+	c = await Client().connect(port)
+	c.send(0x8, struct.pack("!H", 1000) + b"bye")
+	expectEqual(await c.closeCode(), 1000)
+
+async def closeWithReservedCode(port):
+	c = await Client().connect(port)
+	c.send(0x8, struct.pack("!H", 1005))
+	expectEqual(await c.closeCode(), 1002)
+
+async def oversizeFrame(port):
+	c = await Client().connect(port)
+	c.send(0x2, b"", length=AsyncioWebSocketsServer.maxMessageSize + 1) # Refused from the header alone
+	expectEqual(await c.closeCode(), 1009)
+
+async def oversizeFragmentedMessage(port):
+	c = await Client().connect(port)
+	half = b"x" * (AsyncioWebSocketsServer.maxMessageSize // 2 + 1)
+	c.send(0x2, half, final=False)
+	c.send(0x0, half)
+	expectEqual(await c.closeCode(), 1009)
+
+async def oversizeInflatedMessage(port):
+	c = await Client().connect(port, deflate=True)
+	c.send(0x2, deflated(zlib.compressobj(9, zlib.DEFLATED, -15), b"\0" * (4 * AsyncioWebSocketsServer.maxMessageSize)), rsv1=True)
+	expectEqual(await c.closeCode(), 1009)
+
+async def unmaskedFrame(port):
+	c = await Client().connect(port)
+	c.send(0x1, b"plain", masked=False)
+	expectEqual(await c.closeCode(), 1002)
+
+async def fragmentedPing(port):
+	c = await Client().connect(port)
+	c.send(0x9, b"p", final=False)
+	expectEqual(await c.closeCode(), 1002)
+
+async def longPing(port):
+	c = await Client().connect(port)
+	c.send(0x9, b"p" * 126)
+	expectEqual(await c.closeCode(), 1002)
+
+async def messageInsideMessage(port):
+	c = await Client().connect(port)
+	c.send(0x1, b"ab", final=False)
+	c.send(0x1, b"cd")
+	expectEqual(await c.closeCode(), 1002)
+
+async def continuationWithoutMessage(port):
+	c = await Client().connect(port)
+	c.send(0x0, b"cd")
+	expectEqual(await c.closeCode(), 1002)
+
+async def compressedWithoutDeflate(port):
+	c = await Client().connect(port)
+	c.send(0x1, deflated(zlib.compressobj(6, zlib.DEFLATED, -15), b"text"), rsv1=True)
+	expectEqual(await c.closeCode(), 1002)
+
+async def invalidUTF8(port):
+	c = await Client().connect(port)
+	c.send(0x1, b"\xff\xfe")
+	expectEqual(await c.closeCode(), 1007)
+
+checks = [fragmentedText, pingInsideFragments, compressedWithContextTakeover, closeHandshake, closeWithReservedCode,
+	oversizeFrame, oversizeFragmentedMessage, oversizeInflatedMessage, unmaskedFrame, fragmentedPing, longPing,
+	messageInsideMessage, continuationWithoutMessage, compressedWithoutDeflate, invalidUTF8]
+
+async def runChecks(port):
+	failed = 0
+	for check in checks:
+		try:
+			await asyncio.wait_for(check(port), 5.0)
+			print("ok     %s" % check.__name__)
+		except (AssertionError, asyncio.TimeoutError, ConnectionError, RuntimeError) as e:
+			failed += 1
+			print("FAILED %s: %s" % (check.__name__, e or type(e).__name__))
+	return failed
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="AsyncioWebSocketsServer protocol checks")
+	parser.add_argument("--ws-port", type=int, default=9200)
+	parser.add_argument("--http-port", type=int, default=8280)
+	args = parser.parse_args()
+
+	server = AsyncioWebSocketsServer(webSocketPort=args.ws_port, httpPort=args.http_port)
+	try:
+		server.start()
+	except OSError as e:
+		sys.exit("Could not start the server: {}".format(e))
+	failed = asyncio.run(runChecks(args.ws_port))
+	server.stop()
+	server.wait(2000)
+	print("%d of %d checks failed" % (failed, len(checks)))
+	sys.exit(1 if failed else 0)